@@ -6,6 +6,7 @@ import asyncio
 from typing import Callable, Dict
 import uuid
 from ..core.logger import logger
+from ..utils.resilience import backoff_delay
 
 class A2ANetworkClient:
     def __init__(self, server_url: str):
@@ -14,6 +15,7 @@ class A2ANetworkClient:
         self.capability_manifest = self._build_capability_manifest()
         self.handlers = {}
         self.is_connected = False
+        self.recorder = None  # optional core.traffic_recorder.TrafficRecorder
         
     def _build_capability_manifest(self) -> Dict:
         """Build capability manifest for post-handshake"""
@@ -65,6 +67,8 @@ class A2ANetworkClient:
         """Background task to listen for incoming messages"""
         try:
             async for message in self.websocket:
+                if self.recorder:
+                    self.recorder.record_a2a(message)
                 await self.handle_incoming_message(json.loads(message))
         except websockets.exceptions.ConnectionClosed:
             logger.warn_risk("⚠️ A2A connection lost")
@@ -90,19 +94,21 @@ class A2ANetworkClient:
             logger.info_a2a(f"Message received: {msg_type}")
     
     async def reconnect_with_backoff(self):
-        """Reconnect with exponential backoff"""
-        backoff_time = 1
-        max_backoff = 60
+        """Reconnect with jittered exponential backoff so agents don't reconnect in lockstep"""
+        attempt = 0
         
         while not self.is_connected:
             try:
-                await asyncio.sleep(backoff_time)
+                await asyncio.sleep(backoff_delay(attempt, base=1.0, cap=60.0))
                 await self.connect()
                 if self.is_connected:
                     break
-                backoff_time = min(backoff_time * 2, max_backoff)
+                attempt += 1
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"A2A reconnection attempt failed: {e}")
+                attempt += 1
     
     async def close_connection(self):
         """Close A2A connection"""
@@ -0,0 +1,49 @@
+"""Keystore decryption cost across scrypt work factors
+
+The decrypt happens once per process start, so this is the number that
+bounds how fast a restarted agent can sign again:
+
+    python -m benchmarks.bench_keystore --output bench_keystore.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.stats import LatencyRecorder
+
+def bench_decrypt(n: int, r: int, p: int, rounds: int) -> dict:
+    from syndicate.keystore import decrypt_keystore, encrypt_keystore
+    private_key = os.urandom(32)
+    document = encrypt_keystore(private_key, "benchmark", "0x" + "00" * 20, n=n, r=r, p=p)
+    recorder = LatencyRecorder(f"keystore.decrypt n=2^{n.bit_length() - 1} r={r} p={p}")
+    recorder.start()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        decrypted = decrypt_keystore(document, "benchmark")
+        recorder.record((time.perf_counter() - start) * 1000)
+        assert bytes(decrypted) == private_key
+    recorder.stop()
+    return recorder.summary()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Keystore KDF cost benchmark")
+    parser.add_argument("--output", default="bench_keystore.json")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--log-n", type=int, nargs="+", default=[14, 16, 18])
+    parser.add_argument("--r", type=int, default=8)
+    parser.add_argument("--p", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    results = [bench_decrypt(2**log_n, args.r, args.p, args.rounds) for log_n in args.log_n]
+    with open(args.output, "w") as f:
+        json.dump({"generated_at": time.time(), "results": results}, f, indent=2)
+    for result in results:
+        print(f"{result['name']:<40} p50 {result['latency_ms']['p50']:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
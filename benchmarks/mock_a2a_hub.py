@@ -0,0 +1,55 @@
+"""Local WebSocket A2A hub for Syndicate benchmarks"""
+
+import asyncio
+import json
+from typing import Dict, Optional, Set
+import websockets
+
+class MockA2AHub:
+    """Relays every frame a client sends to all other connected clients"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.clients: Set = set()
+        self.frames_relayed = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, websocket):
+        self.clients.add(websocket)
+        try:
+            async for frame in websocket:
+                await self._relay(frame, exclude=websocket)
+        finally:
+            self.clients.discard(websocket)
+
+    async def _relay(self, frame, exclude=None):
+        targets = [c for c in self.clients if c is not exclude]
+        if targets:
+            websockets.broadcast(targets, frame)
+            self.frames_relayed += len(targets)
+
+    async def inject(self, message: Dict, exclude=None):
+        """Push a message to connected clients as if a peer had sent it"""
+        await self._relay(json.dumps(message), exclude=exclude)
+
+    async def wait_for_clients(self, count: int, timeout: Optional[float] = 5.0):
+        """Wait until at least `count` clients are connected"""
+        async def _wait():
+            while len(self.clients) < count:
+                await asyncio.sleep(0.005)
+        await asyncio.wait_for(_wait(), timeout)
@@ -0,0 +1,138 @@
+"""Local JSON-RPC stand-in for Syndicate benchmarks"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from aiohttp import web
+
+@dataclass
+class MockRPCConfig:
+    latency_ms: float = 2.0
+    jitter_ms: float = 0.5
+    error_rate: float = 0.0       # fraction of requests answered with HTTP 500
+    throttle_rate: float = 0.0    # fraction of requests answered with HTTP 429
+    retry_after: Optional[float] = None
+    chain_id: int = 10143
+    seed: int = 1337
+
+class MockRPCServer:
+    """Deterministic (seeded) JSON-RPC server with latency, error and 429 injection.
+
+    Single requests and JSON-RPC batches are both supported. Responses are
+    shaped like a Monad node's for the methods Syndicate calls; anything
+    unknown answers "0x0".
+    """
+
+    def __init__(self, config: Optional[MockRPCConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockRPCConfig()
+        self.host = host
+        self.port = port
+        self.rng = random.Random(self.config.seed)
+        self.block_number = 1_000_000
+        self.nonce = 0
+        self.request_count = 0
+        self.status_counts: Dict[int, int] = {}
+        self.method_handlers = {}
+        self._runner = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    def _count(self, status: int):
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        delay = self.config.latency_ms + self.rng.uniform(-1, 1) * self.config.jitter_ms
+        await asyncio.sleep(max(0.0, delay) / 1000)
+
+        roll = self.rng.random()
+        if roll < self.config.throttle_rate:
+            self._count(429)
+            headers = {}
+            if self.config.retry_after is not None:
+                headers["Retry-After"] = str(self.config.retry_after)
+            return web.Response(status=429, headers=headers)
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            self._count(500)
+            return web.Response(status=500)
+
+        body = await request.json()
+        self._count(200)
+        if isinstance(body, list):
+            return web.json_response([self._dispatch(call) for call in body])
+        return web.json_response(self._dispatch(body))
+
+    def _dispatch(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        method = call.get("method")
+        params = call.get("params", [])
+        handler = self.method_handlers.get(method)
+        if handler is not None:
+            result = handler(params)
+        else:
+            result = self._default_result(method, params)
+        return {"jsonrpc": "2.0", "id": call.get("id", 1), "result": result}
+
+    def _default_result(self, method: str, params: list) -> Any:
+        if method == "eth_chainId":
+            return hex(self.config.chain_id)
+        if method == "eth_blockNumber":
+            self.block_number += 1
+            return hex(self.block_number)
+        if method == "eth_gasPrice":
+            return hex(50 * 10**9)
+        if method == "eth_estimateGas":
+            return hex(150_000)
+        if method == "eth_getBalance":
+            return hex(10 * 10**18)
+        if method == "eth_getTransactionCount":
+            return hex(self.nonce)
+        if method in ("eth_sendTransaction", "eth_sendRawTransaction"):
+            self.nonce += 1
+            return "0x" + f"{self.nonce:064x}"
+        if method == "eth_call":
+            # (address router, uint256 amountOut) - what LENS.getAmountOut returns
+            router = "00" * 12 + "5d4a4f430ca3b1b2db86b9cfe48a5316800f5fb2"
+            return "0x" + router + f"{10**18:064x}"
+        return "0x0"
+
+async def serve_forever(config: MockRPCConfig, port: int):
+    """Run a mock server until cancelled (python -m benchmarks.mock_rpc_server)"""
+    server = await MockRPCServer(config, port=port).start()
+    print(f"Mock RPC listening on {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Local mock Monad JSON-RPC server")
+    parser.add_argument("--port", type=int, default=8545)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=None)
+    args = parser.parse_args()
+    asyncio.run(serve_forever(MockRPCConfig(
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+    ), args.port))
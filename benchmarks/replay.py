@@ -0,0 +1,219 @@
+"""Replay recorded Syndicate traffic against the local stack
+
+Recordings come from core.traffic_recorder (set TRAFFIC_RECORD_PATH on a
+running agent). Replaying one reproduces the RPC brownout or alert storm it
+captured against the current code, at 1x or accelerated speed:
+
+    python -m benchmarks.replay run incident.jsonl.gz --speed 10 --output new.json
+    python -m benchmarks.replay compare old.json new.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional
+from aiohttp import web
+
+from benchmarks.mock_rpc_server import MockRPCConfig, MockRPCServer
+from benchmarks.stats import LatencyRecorder
+
+RETRYABLE_STATUSES = (0, 403, 429)
+
+def _call_key(method: str, params) -> str:
+    return method + json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+class RecordedRPCServer(MockRPCServer):
+    """Answers each request with the next recorded outcome for the same call.
+
+    Status codes, Retry-After and latency are replayed as captured (latency
+    scaled by `speed`), so a recorded brownout looks the same to the failover
+    manager under test. Calls that were never recorded fall back to the
+    MockRPCServer defaults.
+    """
+
+    def __init__(self, rpc_records: List[Dict], speed: float = 1.0):
+        super().__init__(MockRPCConfig(latency_ms=0.0, jitter_ms=0.0))
+        self.speed = speed
+        self.outcomes: Dict[str, deque] = defaultdict(deque)
+        for record in rpc_records:
+            self.outcomes[_call_key(record["method"], record["params"])].append(record)
+        self.unmatched = 0
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        body = await request.json()
+        calls = body if isinstance(body, list) else [body]
+        queue = self.outcomes.get(_call_key(calls[0].get("method"), calls[0].get("params", [])))
+        if not queue:
+            self.unmatched += 1
+            self._count(200)
+            responses = [self._dispatch(call) for call in calls]
+            return web.json_response(responses if isinstance(body, list) else responses[0])
+
+        record = queue.popleft()
+        await asyncio.sleep(record["latency_ms"] / 1000 / self.speed)
+        status = record["status"] or 503  # connection failures come back as 503
+        self._count(status)
+        if status != 200:
+            headers = {}
+            if record.get("retry_after") is not None:
+                headers["Retry-After"] = str(record["retry_after"])
+            return web.Response(status=status, headers=headers)
+        response = dict(record["response"] or {})
+        response["id"] = calls[0].get("id", 1)
+        return web.json_response(response)
+
+def logical_rpc_calls(rpc_records: List[Dict]) -> List[Dict]:
+    """Collapse retries into the call that started them.
+
+    A record that follows a retryable failure (429/403/connection error) of
+    the same method and params is a retry made by call_rpc, not a new request
+    from the agent, so it is not re-issued by the replayer.
+    """
+    retrying = {}
+    calls = []
+    for record in rpc_records:
+        key = _call_key(record["method"], record["params"])
+        if not retrying.get(key):
+            calls.append(record)
+        retrying[key] = record["status"] in RETRYABLE_STATUSES
+    return calls
+
+async def replay(path: str, speed: float = 1.0) -> Dict:
+    """Replay a recording and return latency summaries plus risk decisions"""
+    from core.traffic_recorder import load_recording
+    from core.risk_manager import CollaborativeRiskManager
+    from a2a.message_handler import A2AMessageHandler
+    from a2a.network_client import A2ANetworkClient
+    from benchmarks.run_benchmarks import build_rpc_manager
+
+    records = list(load_recording(path))
+    rpc_records = [r for r in records if r["kind"] == "rpc"]
+    a2a_records = [r for r in records if r["kind"] == "a2a"]
+
+    server = await RecordedRPCServer(rpc_records, speed).start()
+    rpc_manager = build_rpc_manager([server.url], chain_id=None)
+
+    risk_manager = CollaborativeRiskManager()
+
+    async def on_adjust(params):
+        return params
+
+    risk_manager.register_external_advice_handler(on_adjust)
+    handler = A2AMessageHandler(A2ANetworkClient("ws://replay.invalid"), risk_manager)
+
+    rpc_latency = LatencyRecorder("replay.rpc")
+    a2a_latency = LatencyRecorder("replay.a2a")
+    decisions = []
+    rpc_outcomes = []
+    started_at = time.monotonic()
+
+    async def at(t: float):
+        delay = t / speed - (time.monotonic() - started_at)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def replay_rpc(seq: int, record: Dict):
+        await at(record["t"])
+        start = time.perf_counter()
+        try:
+            await rpc_manager.call_rpc(record["method"], record["params"])
+            rpc_latency.record((time.perf_counter() - start) * 1000)
+            rpc_outcomes.append({"seq": seq, "method": record["method"], "ok": True})
+        except Exception as e:
+            rpc_latency.record_error()
+            rpc_outcomes.append({"seq": seq, "method": record["method"], "ok": False, "error": str(e)})
+
+    async def replay_a2a():
+        # Frames are applied in order, as listen_for_messages would
+        for seq, record in enumerate(a2a_records):
+            await at(record["t"])
+            message = json.loads(record["frame"])
+            start = time.perf_counter()
+            await handler.handle_incoming_message(message)
+            a2a_latency.record((time.perf_counter() - start) * 1000)
+            if message.get("type") == "risk_alert":
+                decisions.append({"seq": seq, "params": risk_manager.get_adjusted_risk_parameters()})
+
+    rpc_latency.start()
+    a2a_latency.start()
+    try:
+        await asyncio.gather(
+            replay_a2a(),
+            *(replay_rpc(seq, r) for seq, r in enumerate(logical_rpc_calls(rpc_records))),
+        )
+    finally:
+        rpc_latency.stop()
+        a2a_latency.stop()
+        await rpc_manager.close_session()
+        await server.stop()
+
+    rpc_outcomes.sort(key=lambda o: o["seq"])
+    return {
+        "recording": path,
+        "speed": speed,
+        "results": [rpc_latency.summary(), a2a_latency.summary()],
+        "server_status_counts": server.status_counts,
+        "unmatched_rpc_requests": server.unmatched,
+        "rpc_outcomes": rpc_outcomes,
+        "risk_decisions": decisions,
+    }
+
+def compare_reports(old: Dict, new: Dict) -> List[str]:
+    """Human-readable differences in latency and decisions between two replays"""
+    lines = []
+    previous = {r["name"]: r for r in old["results"]}
+    for result in new["results"]:
+        before = previous.get(result["name"])
+        if before:
+            lines.append(
+                f"{result['name']}: p50 {before['latency_ms']['p50']} -> {result['latency_ms']['p50']} ms, "
+                f"p99 {before['latency_ms']['p99']} -> {result['latency_ms']['p99']} ms, "
+                f"errors {before['errors']} -> {result['errors']}"
+            )
+    for a, b in zip(old["risk_decisions"], new["risk_decisions"]):
+        if a["params"] != b["params"]:
+            lines.append(f"risk decision diverged at frame {b['seq']}: {a['params']} -> {b['params']}")
+            break
+    if len(old["risk_decisions"]) != len(new["risk_decisions"]):
+        lines.append(f"risk decisions: {len(old['risk_decisions'])} -> {len(new['risk_decisions'])}")
+    failed_old = sum(1 for o in old["rpc_outcomes"] if not o["ok"])
+    failed_new = sum(1 for o in new["rpc_outcomes"] if not o["ok"])
+    if failed_old != failed_new:
+        lines.append(f"failed rpc calls: {failed_old} -> {failed_new}")
+    return lines
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded Syndicate traffic")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run")
+    run.add_argument("recording")
+    run.add_argument("--speed", type=float, default=1.0, help="1.0 = real time, 10 = ten times faster")
+    run.add_argument("--output", default="replay_results.json")
+    cmp_parser = sub.add_parser("compare")
+    cmp_parser.add_argument("old")
+    cmp_parser.add_argument("new")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = asyncio.run(replay(args.recording, args.speed))
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        for result in report["results"]:
+            print(f"{result['name']:<14} count {result['count']:>6}  p50 {result['latency_ms']['p50']:.3f} ms  "
+                  f"p99 {result['latency_ms']['p99']:.3f} ms  errors {result['errors']}")
+        return 0
+
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    for line in compare_reports(old, new):
+        print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""Hot-path benchmark suite for Syndicate agent
+
+Runs every scenario against local stand-ins (benchmarks.mock_rpc_server and
+benchmarks.mock_a2a_hub) so results are reproducible and need no network:
+
+    python -m benchmarks.run_benchmarks --output bench_results.json
+    python -m benchmarks.run_benchmarks --baseline bench_results.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.mock_a2a_hub import MockA2AHub
+from benchmarks.mock_rpc_server import MockRPCConfig, MockRPCServer
+from benchmarks.stats import LatencyRecorder
+
+class RPCReadClient:
+    """Minimal viem-style public client that answers read_contract via eth_call"""
+
+    def __init__(self, rpc_manager):
+        self.rpc_manager = rpc_manager
+
+    async def read_contract(self, request: Dict):
+        result = await self.rpc_manager.call_rpc("eth_call", [{"to": request["address"], "data": "0x"}, "latest"])
+        raw = result["result"][2:]
+        words = [raw[i:i + 64] for i in range(0, len(raw), 64)]
+        return "0x" + words[0][24:], int(words[1], 16)
+
+def build_rpc_manager(urls: List[str], chain_id: int):
+    from syndicate.rpc_manager import DynamicFailoverManager, RPCEndpoint
+    endpoints = [RPCEndpoint(url=url, priority=i) for i, url in enumerate(urls, start=1)]
+    return DynamicFailoverManager(endpoints, expected_chain_id=chain_id)
+
+async def bench_call_rpc(rpc_url: str, chain_id: int, requests: int, concurrency: int) -> Dict:
+    """DynamicFailoverManager.call_rpc throughput under concurrent callers"""
+    rpc_manager = build_rpc_manager([rpc_url], chain_id)
+    await rpc_manager.warm_up()
+    recorder = LatencyRecorder("rpc.call_rpc")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await rpc_manager.call_rpc("eth_blockNumber", [])
+                recorder.record((time.perf_counter() - start) * 1000)
+            except Exception:
+                recorder.record_error()
+
+    recorder.start()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    recorder.stop()
+    await rpc_manager.close_session()
+    return recorder.summary()
+
+async def bench_rpc_failover(healthy_url: str, throttled_url: str, chain_id: int, requests: int) -> Dict:
+    """call_rpc when the primary endpoint answers 429s"""
+    rpc_manager = build_rpc_manager([throttled_url, healthy_url], chain_id)
+    recorder = LatencyRecorder("rpc.call_rpc_throttled_primary")
+    recorder.start()
+    for _ in range(requests):
+        start = time.perf_counter()
+        try:
+            await rpc_manager.call_rpc("eth_blockNumber", [])
+            recorder.record((time.perf_counter() - start) * 1000)
+        except Exception:
+            recorder.record_error()
+    recorder.stop()
+    await rpc_manager.close_session()
+    return recorder.summary()
+
+async def bench_executor(rpc_url: str, chain_id: int, iterations: int) -> List[Dict]:
+    """CostAwareExecutor quote, gas estimate and execute flows"""
+    from syndicate.blockchain_integration import CostAwareExecutor
+    rpc_manager = build_rpc_manager([rpc_url], chain_id)
+    await rpc_manager.warm_up()
+    executor = CostAwareExecutor(rpc_manager, "testnet", public_client=RPCReadClient(rpc_manager))
+    token = "0x" + "11" * 20
+    tx = {"to": token, "value": hex(10**16), "data": "0x00"}
+
+    flows = {
+        "executor.get_token_quote": lambda: executor.get_token_quote(token, 10**16, True),
+        "executor.estimate_gas_cost": lambda: executor.estimate_gas_cost(dict(tx)),
+        "executor.execute_transaction": lambda: executor.execute_transaction_with_priority(dict(tx)),
+    }
+    results = []
+    for name, factory in flows.items():
+        recorder = LatencyRecorder(name)
+        recorder.start()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await factory()
+            recorder.record((time.perf_counter() - start) * 1000)
+        recorder.stop()
+        results.append(recorder.summary())
+    await rpc_manager.close_session()
+    return results
+
+async def bench_a2a_throughput(messages: int) -> Dict:
+    """Frames per second through A2ANetworkClient via the local hub"""
+    import websockets
+    from a2a.network_client import A2ANetworkClient
+
+    hub = await MockA2AHub().start()
+    client = A2ANetworkClient(hub.url)
+    recorder = LatencyRecorder("a2a.message_throughput")
+    received = asyncio.Event()
+    original_handler = client.handle_incoming_message
+
+    async def timed_handler(message: Dict):
+        await original_handler(message)
+        sent_at = message.get("payload", {}).get("sent_at")
+        if sent_at is not None:
+            recorder.record((time.perf_counter() - sent_at) * 1000)
+            if len(recorder.samples_ms) >= messages:
+                received.set()
+
+    client.handle_incoming_message = timed_handler
+    await client.connect()
+    async with websockets.connect(hub.url) as peer:
+        await hub.wait_for_clients(2)
+        recorder.start()
+        for seq in range(messages):
+            await peer.send(json.dumps({
+                "type": "market_update",
+                "payload": {"symbol": "MON", "seq": seq, "sent_at": time.perf_counter()},
+            }))
+        try:
+            await asyncio.wait_for(received.wait(), timeout=30)
+        except asyncio.TimeoutError:
+            recorder.errors = messages - len(recorder.samples_ms)
+        recorder.stop()
+    await client.close_connection()
+    await hub.stop()
+    return recorder.summary()
+
+async def bench_risk_alert_storm(alerts: int) -> Dict:
+    """CollaborativeRiskManager under a burst of risk alerts"""
+    from core.risk_manager import CollaborativeRiskManager
+    risk_manager = CollaborativeRiskManager()
+
+    async def on_adjust(params):
+        return params
+
+    risk_manager.register_external_advice_handler(on_adjust)
+    kinds = [("high_volatility", "high"), ("high_volatility", "medium"), ("market_crash_imminent", "high")]
+    recorder = LatencyRecorder("risk.alert_storm")
+    recorder.start()
+    for i in range(alerts):
+        risk_type, severity = kinds[i % len(kinds)]
+        start = time.perf_counter()
+        await risk_manager.process_external_risk_advice({
+            "source_agent": f"peer_{i % 16}",
+            "risk_type": risk_type,
+            "severity": severity,
+            "details": {"seq": i},
+        })
+        recorder.record((time.perf_counter() - start) * 1000)
+    recorder.stop()
+    return recorder.summary()
+
+def compare_to_baseline(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Names of benchmarks whose p50 latency or throughput regressed beyond tolerance"""
+    previous = {r["name"]: r for r in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(result["name"])
+        if not old:
+            continue
+        if result["latency_ms"]["p50"] > old["latency_ms"]["p50"] * (1 + tolerance):
+            regressions.append(f"{result['name']}: p50 {old['latency_ms']['p50']} -> {result['latency_ms']['p50']} ms")
+        if result["throughput_per_s"] < old["throughput_per_s"] * (1 - tolerance):
+            regressions.append(f"{result['name']}: throughput {old['throughput_per_s']} -> {result['throughput_per_s']}/s")
+    return regressions
+
+async def run_suite(args) -> Dict:
+    chain_id = 10143
+    healthy = await MockRPCServer(MockRPCConfig(latency_ms=args.rpc_latency_ms, seed=args.seed)).start()
+    throttled = await MockRPCServer(MockRPCConfig(
+        latency_ms=args.rpc_latency_ms, throttle_rate=0.5, retry_after=0.05, seed=args.seed
+    )).start()
+    try:
+        results = [
+            await bench_call_rpc(healthy.url, chain_id, args.requests, args.concurrency),
+            await bench_rpc_failover(healthy.url, throttled.url, chain_id, args.requests // 10),
+            *await bench_executor(healthy.url, chain_id, args.iterations),
+            await bench_a2a_throughput(args.messages),
+            await bench_risk_alert_storm(args.alerts),
+        ]
+    finally:
+        await healthy.stop()
+        await throttled.stop()
+    return {
+        "generated_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Syndicate hot-path benchmarks")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--alerts", type=int, default=5000)
+    parser.add_argument("--rpc-latency-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_suite(args))
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    for result in report["results"]:
+        lat = result["latency_ms"]
+        print(f"{result['name']:<34} {result['throughput_per_s']:>10.1f}/s  "
+              f"p50 {lat['p50']:.3f} ms  p99 {lat['p99']:.3f} ms  errors {result['errors']}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(report["results"], json.load(f)["results"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Latency/throughput bookkeeping for Syndicate benchmarks"""
+
+import time
+from typing import Dict, List
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+class LatencyRecorder:
+    def __init__(self, name: str):
+        self.name = name
+        self.samples_ms: List[float] = []
+        self.errors = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+
+    def stop(self):
+        self.finished_at = time.perf_counter()
+
+    def record(self, latency_ms: float):
+        self.samples_ms.append(latency_ms)
+
+    def record_error(self):
+        self.errors += 1
+
+    def summary(self) -> Dict:
+        """Throughput and latency percentiles in a JSON-serializable dict"""
+        samples = sorted(self.samples_ms)
+        elapsed = (self.finished_at or time.perf_counter()) - (self.started_at or time.perf_counter())
+        count = len(samples)
+        return {
+            "name": self.name,
+            "count": count,
+            "errors": self.errors,
+            "elapsed_s": round(elapsed, 6),
+            "throughput_per_s": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            "latency_ms": {
+                "min": round(samples[0], 4) if samples else 0.0,
+                "p50": round(percentile(samples, 50), 4),
+                "p90": round(percentile(samples, 90), 4),
+                "p99": round(percentile(samples, 99), 4),
+                "max": round(samples[-1], 4) if samples else 0.0,
+                "mean": round(sum(samples) / count, 4) if count else 0.0,
+            },
+        }
@@ -1,12 +1,11 @@
 
-### `config/settings.py`
-```python
 """Configuration settings for Syndicate agent"""
 
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Exported variables win over .env so restarts don't re-parse stale values
+load_dotenv(override=False)
 
 # Monad Configuration
 MONAD_RPC_ENDPOINTS = [
@@ -53,8 +52,6 @@ NADFUN_CONTRACTS = {
     }
 }
 
-# Current environment (testnet/mainnet)
-NETWORK = os.getenv("MONAD_NETWORK", "testnet")
 CONFIG = NADFUN_CONTRACTS[NETWORK]
 
 # A2A Configuration
@@ -65,8 +62,55 @@ MAX_TRADE_SIZE_PERCENTAGE = float(os.getenv("MAX_TRADE_SIZE_PERCENTAGE", "0.1"))
 VOLATILITY_THRESHOLD = float(os.getenv("VOLATILITY_THRESHOLD", "0.05"))
 COOLDOWN_PERIOD = int(os.getenv("COOLDOWN_PERIOD", "30"))
 
+# Simulate trades with eth_call instead of sending them
+DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Wallet keystore. N=2**16 decrypts in ~0.25 s, keeping restarts sub-second;
+# geth's "standard" 2**18 takes ~1 s (see benchmarks/bench_keystore.py)
+KEYSTORE_PASSWORD = os.getenv("KEYSTORE_PASSWORD", "")
+KEYSTORE_SCRYPT_N = int(os.getenv("KEYSTORE_SCRYPT_N", str(2**16)))
+KEYSTORE_SCRYPT_R = int(os.getenv("KEYSTORE_SCRYPT_R", "8"))
+KEYSTORE_SCRYPT_P = int(os.getenv("KEYSTORE_SCRYPT_P", "1"))
+
+# Wallet pool (WALLET_POOL_SIZE=1 keeps the single-wallet behaviour)
+WALLET_POOL_SIZE = int(os.getenv("WALLET_POOL_SIZE", "1"))
+WALLET_POOL_MNEMONIC = os.getenv("WALLET_POOL_MNEMONIC", "")
+WALLET_POOL_MIN_BALANCE = float(os.getenv("WALLET_POOL_MIN_BALANCE", "0.5"))
+WALLET_POOL_TARGET_BALANCE = float(os.getenv("WALLET_POOL_TARGET_BALANCE", "2.0"))
+
+# Wallet health monitor
+WALLET_LOW_BALANCE = float(os.getenv("WALLET_LOW_BALANCE", "0.1"))  # MON
+WALLET_STUCK_AFTER_BLOCKS = int(os.getenv("WALLET_STUCK_AFTER_BLOCKS", "20"))
+
+# Contract verification
+VERIFY_CONCURRENCY = int(os.getenv("VERIFY_CONCURRENCY", "4"))
+VERIFY_RETRIES = int(os.getenv("VERIFY_RETRIES", "3"))
+
+# State journal (empty JOURNAL_DIR disables persistence)
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", ".syndicate-state")
+JOURNAL_FSYNC_INTERVAL = float(os.getenv("JOURNAL_FSYNC_INTERVAL", "0.05"))  # seconds per group commit
+JOURNAL_SNAPSHOT_BYTES = int(os.getenv("JOURNAL_SNAPSHOT_BYTES", str(4 * 1024 * 1024)))
+
 # Faucet API
 FAUCET_API_URL = "https://agents.devnads.com/v1/faucet"
+
+# Startup
+# "fast" initializes wallet, RPC warm-up and A2A connect concurrently;
+# "sequential" keeps the original one-after-another boot order.
+STARTUP_MODE = os.getenv("STARTUP_MODE", "fast")
+STARTUP_REPORT = os.getenv("STARTUP_REPORT", "true").lower() == "true"
+
+# Runtime: "single" runs everything on one event loop; "multiprocess" splits
+# ingest, A2A, strategy and execution into processes linked by shared memory
+RUNTIME_MODE = os.getenv("RUNTIME_MODE", "single")
+RUNTIME_RING_BYTES = int(os.getenv("RUNTIME_RING_BYTES", str(4 * 1024 * 1024)))
+RUNTIME_SNAPSHOT_BYTES = int(os.getenv("RUNTIME_SNAPSHOT_BYTES", str(1024 * 1024)))
+RUNTIME_STRATEGY = os.getenv("RUNTIME_STRATEGY", "")  # "module:function"
+RUNTIME_INGEST_INTERVAL = float(os.getenv("RUNTIME_INGEST_INTERVAL", "1.0"))
+RUNTIME_MAX_RESTARTS = int(os.getenv("RUNTIME_MAX_RESTARTS", "5"))
+
+# Traffic recording for benchmarks/replay.py (empty disables recording)
+TRAFFIC_RECORD_PATH = os.getenv("TRAFFIC_RECORD_PATH", "")
@@ -0,0 +1,196 @@
+"""Write-ahead state journal for Syndicate agent"""
+
+import asyncio
+import json
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .logger import logger
+
+# Record: <length:u32><crc32:u32><type:u8><payload>, crc over type + payload
+_HEADER = struct.Struct("<IIB")
+REC_SET = 1
+REC_DELETE = 2
+REC_SNAPSHOT = 3
+
+def _encode(record_type: int, payload: Any) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    crc = zlib.crc32(bytes([record_type]) + body)
+    return _HEADER.pack(len(body), crc, record_type) + body
+
+def _read_records(data: bytes) -> Tuple[List[Tuple[int, Any]], int]:
+    """Decode records until the end or the first torn/corrupt one; returns (records, good_length)"""
+    records, offset = [], 0
+    while offset + _HEADER.size <= len(data):
+        length, crc, record_type = _HEADER.unpack_from(data, offset)
+        start, end = offset + _HEADER.size, offset + _HEADER.size + length
+        if end > len(data):
+            break
+        body = data[start:end]
+        if zlib.crc32(bytes([record_type]) + body) != crc:
+            break
+        records.append((record_type, json.loads(body)))
+        offset = end
+    return records, offset
+
+class Journal:
+    """Key/value agent state made durable with an append-only log plus snapshots.
+
+    Updates are applied to memory at once and queued as binary records; a
+    background task writes and fsyncs the queue every `fsync_interval`
+    seconds, so one fsync covers every update in that window (`commit()`
+    waits for it). When the log outgrows `snapshot_bytes` the whole state is
+    written to a snapshot and the log starts over. Boot reads the snapshot
+    and replays the log, discarding a torn final record from a crash.
+    """
+
+    def __init__(self, directory: Path, fsync_interval: float = 0.05, snapshot_bytes: int = 4 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.wal_path = self.directory / "journal.wal"
+        self.snapshot_path = self.directory / "snapshot.bin"
+        self.fsync_interval = fsync_interval
+        self.snapshot_bytes = snapshot_bytes
+        self.state: Dict[str, Any] = {}
+        self.wal_size = 0
+        self.stats = {"records": 0, "fsyncs": 0, "snapshots": 0, "replayed": 0, "replay_ms": 0.0}
+        self._pending: List[bytes] = []
+        self._waiters: List[asyncio.Future] = []
+        self._file = None
+        self._lock = asyncio.Lock()
+        self._flush_task = None
+
+    def open(self) -> Dict[str, Any]:
+        """Restore state from snapshot + log and open the log for appending"""
+        start = time.perf_counter()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.snapshot_path.is_file():
+            records, _ = _read_records(self.snapshot_path.read_bytes())
+            if records and records[0][0] == REC_SNAPSHOT:
+                self.state = records[0][1]
+            else:
+                logger.warning("Journal snapshot unreadable - replaying log only")
+
+        if self.wal_path.is_file():
+            data = self.wal_path.read_bytes()
+            records, good_length = _read_records(data)
+            for record_type, payload in records:
+                self._apply(record_type, payload)
+            self.stats["replayed"] = len(records)
+            if good_length < len(data):
+                logger.warning(f"Journal: dropping {len(data) - good_length} bytes of torn log tail")
+                with open(self.wal_path, "r+b") as f:
+                    f.truncate(good_length)
+            self.wal_size = good_length
+
+        self._file = open(self.wal_path, "ab")
+        self.stats["replay_ms"] = (time.perf_counter() - start) * 1000
+        logger.info(f"Journal restored {len(self.state)} keys from {self.stats['replayed']} records "
+                    f"in {self.stats['replay_ms']:.1f} ms")
+        return self.state
+
+    def _apply(self, record_type: int, payload: Any):
+        if record_type == REC_SET:
+            self.state[payload[0]] = payload[1]
+        elif record_type == REC_DELETE:
+            self.state.pop(payload, None)
+
+    # Updates
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.state.get(key, default)
+
+    def items(self, prefix: str) -> List[Tuple[str, Any]]:
+        return [(k, v) for k, v in self.state.items() if k.startswith(prefix)]
+
+    def set(self, key: str, value: Any):
+        """Record a new value for key (value must be JSON-serialisable)"""
+        self.state[key] = value
+        self._queue(_encode(REC_SET, [key, value]))
+
+    def delete(self, key: str):
+        if key in self.state:
+            del self.state[key]
+            self._queue(_encode(REC_DELETE, key))
+
+    def _queue(self, record: bytes):
+        self._pending.append(record)
+        self.stats["records"] += 1
+
+    async def commit(self):
+        """Wait until everything queued so far is on disk"""
+        if not self._pending:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            await self.flush()
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        await waiter
+
+    # Durability
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    async def flush(self):
+        """Write and fsync queued records, then snapshot if the log got large"""
+        async with self._lock:
+            waiters, self._waiters = self._waiters, []
+            if self._pending:
+                data = b"".join(self._pending)
+                self._pending = []
+                try:
+                    await asyncio.to_thread(self._write, data)
+                    self.wal_size += len(data)
+                    self.stats["fsyncs"] += 1
+                except OSError as e:
+                    logger.error(f"Journal write failed: {e}")
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            if self.wal_size >= self.snapshot_bytes:
+                # Serialise on the loop so the state can't change mid-dump
+                await asyncio.to_thread(self._snapshot, _encode(REC_SNAPSHOT, self.state))
+
+    def _snapshot(self, snapshot: bytes):
+        """Persist the full state and start an empty log.
+
+        Log records are idempotent sets/deletes, so a crash between the
+        snapshot rename and the log truncation only replays work already in
+        the snapshot.
+        """
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._file.close()
+        self._file = open(self.wal_path, "wb")
+        os.fsync(self._file.fileno())
+        self.wal_size = 0
+        self.stats["snapshots"] += 1
+
+    def start(self):
+        """Flush on a fixed cadence in the background (group commit)"""
+        async def _loop():
+            while True:
+                await asyncio.sleep(self.fsync_interval)
+                await self.flush()
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(_loop())
+        return self._flush_task
+
+    async def close(self):
+        """Flush, snapshot and close; the next boot reads just the snapshot"""
+        if self._flush_task:
+            self._flush_task.cancel()
+        await self.flush()
+        if self._file:
+            await asyncio.to_thread(self._snapshot, _encode(REC_SNAPSHOT, self.state))
+            self._file.close()
+            self._file = None
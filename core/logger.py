@@ -42,6 +42,21 @@ class ProLogger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
+    def info(self, message: str):
+        self.logger.info(message)
+    
+    def warning(self, message: str):
+        self.logger.warning(message)
+    
+    def error(self, message: str):
+        self.logger.error(message)
+    
+    def critical(self, message: str):
+        self.logger.critical(message)
+    
+    def debug(self, message: str):
+        self.logger.debug(message)
+    
     def info_a2a(self, message: str):
         """Log A2A-specific messages in blue"""
         self.logger.info(f"{Fore.BLUE}[A2A] {message}")
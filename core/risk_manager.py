@@ -1,7 +1,8 @@
 """Collaborative risk management for Syndicate agent"""
 
 import asyncio
-from typing import Dict, Any, Callable
+import time
+from typing import Dict, Any, Callable, Iterable, Optional
 from ..core.logger import logger
 
 class CollaborativeRiskManager:
@@ -14,12 +15,33 @@ class CollaborativeRiskManager:
         }
         self.external_advice_buffer = []
         self.last_advice_timestamp = 0
+        self.journal = None  # optional core.journal.Journal
+    
+    def attach_journal(self, journal):
+        """Restore risk state from the journal and persist every later change"""
+        self.journal = journal
+        self.local_risk_params.update(journal.get("risk.params", {}))
+        self.last_advice_timestamp = journal.get("risk.last_advice", self.last_advice_timestamp)
+        self.external_advice_buffer = sorted(
+            (advice for _, advice in journal.items("risk.advice.")), key=lambda a: a["timestamp"]
+        )
+    
+    def _persist(self, added: Optional[Dict[str, Any]] = None, expired: Iterable[Dict[str, Any]] = ()):
+        # One record per advice entry, so an alert storm doesn't rewrite the whole buffer
+        if not self.journal:
+            return
+        self.journal.set("risk.params", dict(self.local_risk_params))
+        self.journal.set("risk.last_advice", self.last_advice_timestamp)
+        if added:
+            self.journal.set(f"risk.advice.{added['timestamp']!r}", added)
+        for advice in expired:
+            self.journal.delete(f"risk.advice.{advice['timestamp']!r}")
         
     def register_external_advice_handler(self, handler_func: Callable):
         """Register function to handle external risk advice"""
         self.external_advice_handler = handler_func
     
-    async def process_external_risk_advice(self, advice_ Dict[str, Any]):
+    async def process_external_risk_advice(self, advice_data: Dict[str, Any]):
         """Process external risk advice and adjust local parameters"""
         try:
             source_agent = advice_data.get("source_agent", "unknown")
@@ -29,13 +51,16 @@ class CollaborativeRiskManager:
             
             logger.info_a2a(f"📢 External risk advice from {source_agent}: {risk_type} ({severity})")
             
-            self.external_advice_buffer.append({
-                "timestamp": asyncio.get_event_loop().time(),
+            # Wall-clock time so buffered advice can outlive a restart
+            self.last_advice_timestamp = time.time()
+            advice_entry = {
+                "timestamp": self.last_advice_timestamp,
                 "source": source_agent,
                 "risk_type": risk_type,
                 "severity": severity,
                 "details": details
-            })
+            }
+            self.external_advice_buffer.append(advice_entry)
             
             if risk_type == "high_volatility":
                 if severity == "high":
@@ -52,11 +77,13 @@ class CollaborativeRiskManager:
                 self.local_risk_params["cooldown_period"] = 300
                 logger.critical("🚨 Market crash warning - entering emergency mode")
             
-            current_time = asyncio.get_event_loop().time()
+            current_time = time.time()
+            expired = [a for a in self.external_advice_buffer if current_time - a["timestamp"] >= 300]
             self.external_advice_buffer = [
                 advice for advice in self.external_advice_buffer 
                 if current_time - advice["timestamp"] < 300
             ]
+            self._persist(advice_entry, expired)
             
             if hasattr(self, 'external_advice_handler'):
                 await self.external_advice_handler(self.local_risk_params)
@@ -0,0 +1,179 @@
+"""Shared-memory channels between Syndicate worker processes"""
+
+import asyncio
+import pickle
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Optional
+
+_U64 = struct.Struct("<Q")
+_U32 = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF
+_HEAD, _TAIL, _DATA = 0, 64, 128  # head and tail on separate cache lines
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+def _open(name: Optional[str], size: int, create: bool) -> shared_memory.SharedMemory:
+    if create:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    shm = shared_memory.SharedMemory(name=name)
+    # Only the creating process may unlink; stop the tracker doing it when a worker exits
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+class SharedRingBuffer:
+    """Single-producer/single-consumer ring of length-prefixed messages.
+
+    The producer only writes `head` and the consumer only writes `tail`,
+    both monotonically increasing byte counters, so no lock is needed. A
+    message body is written before `head` is advanced past it. Messages are
+    pickled; all processes are ours.
+    """
+
+    def __init__(self, name: Optional[str] = None, size: int = 4 * 1024 * 1024, create: bool = False):
+        self.shm = _open(name, size, create)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.capacity = (self.shm.size - _DATA) & ~7
+        self.owner = create
+        if create:
+            _U64.pack_into(self.buf, _HEAD, 0)
+            _U64.pack_into(self.buf, _TAIL, 0)
+
+    def _head(self) -> int:
+        return _U64.unpack_from(self.buf, _HEAD)[0]
+
+    def _tail(self) -> int:
+        return _U64.unpack_from(self.buf, _TAIL)[0]
+
+    def __len__(self) -> int:
+        """Bytes currently queued"""
+        return self._head() - self._tail()
+
+    def put_bytes(self, payload: bytes) -> bool:
+        """Append one message; False if the ring is full (caller decides whether to drop or wait)"""
+        record = _align8(4 + len(payload))
+        if record > self.capacity:
+            raise ValueError(f"Message of {len(payload)} bytes exceeds ring capacity")
+        head = self._head()
+        position = head % self.capacity
+        skip = self.capacity - position if position + record > self.capacity else 0
+        if self.capacity - (head - self._tail()) < skip + record:
+            return False
+        if skip:
+            _U32.pack_into(self.buf, _DATA + position, _WRAP)
+            head += skip
+            position = 0
+        start = _DATA + position
+        _U32.pack_into(self.buf, start, len(payload))
+        self.buf[start + 4:start + 4 + len(payload)] = payload
+        _U64.pack_into(self.buf, _HEAD, head + record)
+        return True
+
+    def get_bytes(self) -> Optional[bytes]:
+        """Pop the next message, or None if the ring is empty"""
+        tail, head = self._tail(), self._head()
+        while tail != head:
+            position = tail % self.capacity
+            length = _U32.unpack_from(self.buf, _DATA + position)[0]
+            if length == _WRAP:
+                tail += self.capacity - position
+                continue
+            start = _DATA + position + 4
+            payload = bytes(self.buf[start:start + length])
+            _U64.pack_into(self.buf, _TAIL, tail + _align8(4 + length))
+            return payload
+        _U64.pack_into(self.buf, _TAIL, tail)
+        return None
+
+    def put(self, message: Any) -> bool:
+        return self.put_bytes(pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get(self) -> Any:
+        payload = self.get_bytes()
+        return None if payload is None else pickle.loads(payload)
+
+    async def put_async(self, message: Any, max_wait: float = 0.005):
+        """Put, yielding to the loop while the consumer catches up"""
+        payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        delay = 0.0001
+        while not self.put_bytes(payload):
+            await asyncio.sleep(delay)
+            delay = min(max_wait, delay * 2)
+
+    async def get_async(self, max_wait: float = 0.005) -> Any:
+        """Wait for the next message, backing off from 0.1 ms to `max_wait` while idle"""
+        delay = 0.0001
+        while True:
+            payload = self.get_bytes()
+            if payload is not None:
+                return pickle.loads(payload)
+            await asyncio.sleep(delay)
+            delay = min(max_wait, delay * 2)
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+class SharedSnapshot:
+    """Latest-value cell for state that one process publishes and many read.
+
+    Guarded by a sequence lock: the writer makes the sequence odd, writes,
+    then makes it even again. A reader retries if it saw an odd sequence or
+    the sequence changed under it, and reuses its last decoded value while
+    the sequence is unchanged, so polling is cheap.
+    """
+
+    def __init__(self, name: Optional[str] = None, size: int = 1024 * 1024, create: bool = False):
+        self.shm = _open(name, size, create)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.owner = create
+        self._seq = 0
+        self._cached_seq = -1
+        self._cached = None
+        if create:
+            _U64.pack_into(self.buf, 0, 0)
+            _U32.pack_into(self.buf, 8, 0)
+
+    def publish(self, value: Any):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if 16 + len(payload) > self.shm.size:
+            raise ValueError(f"Snapshot of {len(payload)} bytes exceeds {self.shm.size}")
+        seq = _U64.unpack_from(self.buf, 0)[0]
+        _U64.pack_into(self.buf, 0, seq + 1)
+        _U32.pack_into(self.buf, 8, len(payload))
+        self.buf[16:16 + len(payload)] = payload
+        _U64.pack_into(self.buf, 0, seq + 2)
+
+    def read(self, default: Any = None) -> Any:
+        """Current value (or `default` before the first publish)"""
+        while True:
+            before = _U64.unpack_from(self.buf, 0)[0]
+            if before & 1:
+                continue  # write in progress
+            if before == self._cached_seq:
+                return self._cached
+            if before == 0:
+                return default
+            length = _U32.unpack_from(self.buf, 8)[0]
+            payload = bytes(self.buf[16:16 + length])
+            if _U64.unpack_from(self.buf, 0)[0] == before:
+                self._cached_seq, self._cached = before, pickle.loads(payload)
+                return self._cached
+
+    @property
+    def version(self) -> int:
+        return _U64.unpack_from(self.buf, 0)[0] // 2
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,65 @@
+"""Startup phase timing for Syndicate agent"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List
+from .logger import logger
+
+class StartupProfiler:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a synchronous startup phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, start)
+
+    async def run_phase(self, name: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Time an async startup phase created by factory"""
+        start = time.perf_counter()
+        try:
+            return await factory()
+        finally:
+            self._record(name, start)
+
+    async def run_phases(self, phases: Dict[str, Callable[[], Awaitable[Any]]],
+                         concurrent: bool = True) -> Dict[str, Any]:
+        """Run named phases concurrently (or one by one) and return their results"""
+        if concurrent:
+            results = await asyncio.gather(
+                *(self.run_phase(name, factory) for name, factory in phases.items())
+            )
+            return dict(zip(phases.keys(), results))
+
+        results = {}
+        for name, factory in phases.items():
+            results[name] = await self.run_phase(name, factory)
+        return results
+
+    def _record(self, name: str, start: float):
+        end = time.perf_counter()
+        self.phases.append({
+            "name": name,
+            "offset_ms": (start - self.started_at) * 1000,
+            "duration_ms": (end - start) * 1000,
+        })
+
+    def total_ms(self) -> float:
+        """Milliseconds elapsed since the profiler was created"""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def report(self) -> Dict[str, Any]:
+        """Machine-readable startup report"""
+        return {"total_ms": self.total_ms(), "phases": list(self.phases)}
+
+    def log_report(self):
+        """Log phase timings, slowest first"""
+        logger.info(f"⏱ Startup completed in {self.total_ms():.1f} ms")
+        for phase in sorted(self.phases, key=lambda p: p["duration_ms"], reverse=True):
+            logger.info(f"   {phase['name']:<20} +{phase['offset_ms']:7.1f} ms  {phase['duration_ms']:7.1f} ms")
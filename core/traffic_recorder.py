@@ -0,0 +1,69 @@
+"""Traffic recording for offline replay of Syndicate sessions"""
+
+import gzip
+import json
+import time
+from typing import Any, Dict, Iterator, Optional
+from .logger import logger
+
+class TrafficRecorder:
+    """Append-only, gzip-compressed JSON-lines log of RPC exchanges and A2A frames.
+
+    Each record carries `t`, seconds since recording started on the monotonic
+    clock, so benchmarks.replay can reproduce the original pacing.
+    """
+
+    def __init__(self, path: str, flush_every: int = 256):
+        self.path = path
+        self.flush_every = flush_every
+        self.started_at = time.monotonic()
+        self.records_written = 0
+        self._pending = []
+        self._file = gzip.open(path, "at", encoding="utf-8")
+
+    def _append(self, record: Dict[str, Any]):
+        record["t"] = round(time.monotonic() - self.started_at, 6)
+        self._pending.append(json.dumps(record, separators=(",", ":")))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def record_rpc(self, endpoint: str, method: str, params: list, status: int,
+                   latency_ms: float, response: Optional[Dict] = None,
+                   retry_after: Optional[float] = None):
+        """Record one HTTP exchange made by DynamicFailoverManager.call_rpc"""
+        self._append({
+            "kind": "rpc",
+            "endpoint": endpoint,
+            "method": method,
+            "params": params,
+            "status": status,
+            "latency_ms": round(latency_ms, 3),
+            "response": response,
+            "retry_after": retry_after,
+        })
+
+    def record_a2a(self, frame: str):
+        """Record one raw inbound A2A frame"""
+        self._append({"kind": "a2a", "frame": frame})
+
+    def flush(self):
+        if not self._pending:
+            return
+        try:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._file.flush()
+            self.records_written += len(self._pending)
+        except Exception as e:
+            logger.error(f"Traffic recording write failed: {e}")
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+def load_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield recorded entries in order"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
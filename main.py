@@ -3,58 +3,132 @@
 import asyncio
 import signal
 import sys
-from syndicate.rpc_manager import DynamicFailoverManager, RPCEndpoint
-from syndicate.blockchain_integration import CostAwareExecutor
-from syndicate.nadfun_interactions import NadFunInteractions
-from syndicate.wallet_manager import WalletManager
-from syndicate.contract_verification import ContractVerifier
-from a2a.network_client import A2ANetworkClient
-from core.risk_manager import CollaborativeRiskManager
-from a2a.message_handler import A2AMessageHandler
 from core.logger import logger
-from syndicate.wallet_monitor import WalletMonitor
-from config.settings import MONAD_RPC_ENDPOINTS, A2A_SERVER_URL, NETWORK, CHAIN_ID
+from core.startup import StartupProfiler
+from config.settings import (
+    MONAD_RPC_ENDPOINTS, A2A_SERVER_URL, NETWORK, CHAIN_ID, STARTUP_MODE, STARTUP_REPORT,
+    TRAFFIC_RECORD_PATH, WALLET_POOL_SIZE, RUNTIME_MODE,
+    JOURNAL_DIR, JOURNAL_FSYNC_INTERVAL, JOURNAL_SNAPSHOT_BYTES
+)
+
+# Subsystems are imported inside the startup phases that need them so the
+# interpreter reaches the event loop without paying for viem/aiohttp/websockets
+# imports up front.
+
+def load_wallet():
+    """Load (or create) the agent wallet; runs in a worker thread"""
+    from syndicate.wallet_manager import WalletManager
+    wallet_manager = WalletManager()
+    wallet_data = wallet_manager.load_wallet()
+    return wallet_manager, wallet_data
+
+async def start_rpc():
+    """Build the failover manager, pre-open connections and start keep-alive pings"""
+    from syndicate.rpc_manager import DynamicFailoverManager, RPCEndpoint
+    rpc_endpoints = [
+        RPCEndpoint(url=url, priority=priority)
+        for priority, url in enumerate(MONAD_RPC_ENDPOINTS, start=1)
+    ]
+    rpc_manager = DynamicFailoverManager(rpc_endpoints, expected_chain_id=CHAIN_ID)
+    await rpc_manager.warm_up()
+    rpc_manager.start_keepalive()
+    return rpc_manager
+
+async def start_a2a():
+    """Connect to the A2A network and start the heartbeat system"""
+    from a2a.network_client import A2ANetworkClient
+    from a2a.message_handler import A2AMessageHandler
+    from core.risk_manager import CollaborativeRiskManager
+    a2a_client = A2ANetworkClient(A2A_SERVER_URL)
+    risk_manager = CollaborativeRiskManager()
+    message_handler = A2AMessageHandler(a2a_client, risk_manager)
+    await a2a_client.connect()
+    await message_handler.start_heartbeat_system()
+    return a2a_client, risk_manager, message_handler
+
+def open_journal():
+    """Replay the state journal from the last run; runs in a worker thread"""
+    if not JOURNAL_DIR:
+        return None
+    from core.journal import Journal
+    journal = Journal(JOURNAL_DIR, JOURNAL_FSYNC_INTERVAL, JOURNAL_SNAPSHOT_BYTES)
+    journal.open()
+    return journal
 
 async def main():
     """Main orchestrator for Syndicate"""
+    profiler = StartupProfiler()
     
     logger.success("🚀 Starting Syndicate v1.0.0 - Monad x NadFun Integration")
-    logger.info(f"Network: {NETWORK} (Chain ID: {CHAIN_ID})")
+    logger.info(f"Network: {NETWORK} (Chain ID: {CHAIN_ID}) - startup mode: {STARTUP_MODE}")
     
-    # Initialize wallet manager
-    wallet_manager = WalletManager()
-    wallet_data = wallet_manager.load_wallet()
+    # Wallet, RPC pool and A2A connection don't depend on each other
+    results = await profiler.run_phases({
+        "wallet": lambda: asyncio.to_thread(load_wallet),
+        "rpc_warmup": start_rpc,
+        "a2a_connect": start_a2a,
+        "journal": lambda: asyncio.to_thread(open_journal),
+    }, concurrent=STARTUP_MODE == "fast")
+    wallet_manager, wallet_data = results["wallet"]
+    rpc_manager = results["rpc_warmup"]
+    a2a_client, risk_manager, message_handler = results["a2a_connect"]
+    journal = results["journal"]
+    if journal:
+        risk_manager.attach_journal(journal)
     wallet_address = wallet_data["address"]
     
+    recorder = None
+    if TRAFFIC_RECORD_PATH:
+        from core.traffic_recorder import TrafficRecorder
+        recorder = TrafficRecorder(TRAFFIC_RECORD_PATH)
+        rpc_manager.recorder = recorder
+        a2a_client.recorder = recorder
+        logger.info(f"Recording RPC and A2A traffic to {TRAFFIC_RECORD_PATH}")
+    
     logger.info(f"Using wallet: {wallet_address}")
     
-    # Fund wallet if on testnet
+    # Fund wallet if on testnet; the faucet is slow and not needed to start trading
     if NETWORK == "testnet":
         logger.info("Checking wallet balance for testnet funding...")
-        # Attempt to fund wallet via faucet
-        await wallet_manager.fund_wallet_via_faucet(wallet_address)
-    
-    # Setup RPC endpoints with failover
-    rpc_endpoints = [
-        RPCEndpoint(url=MONAD_RPC_ENDPOINTS[0], priority=1),
-        RPCEndpoint(url=MONAD_RPC_ENDPOINTS[1], priority=2),
-        RPCEndpoint(url=MONAD_RPC_ENDPOINTS[2], priority=3)
-    ]
+        asyncio.create_task(wallet_manager.fund_wallet_via_faucet(wallet_address))
     
-    rpc_manager = DynamicFailoverManager(rpc_endpoints)
-    executor = CostAwareExecutor(rpc_manager, NETWORK)
-    nadfun = NadFunInteractions(NETWORK)
-    contract_verifier = ContractVerifier()
-    wallet_monitor = WalletMonitor(rpc_manager)
+    with profiler.phase("subsystems"):
+        from syndicate.blockchain_integration import CostAwareExecutor
+        from syndicate.nadfun_interactions import NadFunInteractions
+        from syndicate.contract_verification import ContractVerifier
+        from syndicate.wallet_monitor import WalletMonitor
+        
+        # Both share the process-wide public client from syndicate.clients
+        executor = CostAwareExecutor(rpc_manager, NETWORK)
+        nadfun = NadFunInteractions(NETWORK)
+        contract_verifier = ContractVerifier()
+        wallet_monitor = WalletMonitor(rpc_manager, [wallet_address], a2a_client)
     
-    # Setup A2A network
-    a2a_client = A2ANetworkClient(A2A_SERVER_URL)
-    risk_manager = CollaborativeRiskManager()
-    message_handler = A2AMessageHandler(a2a_client, risk_manager)
+    from syndicate.wallet_state import WalletStateTracker
+    wallet_state = WalletStateTracker(rpc_manager, [wallet_address])
+    executor.wallet_state = wallet_state
+    executor.wallet_address = wallet_address
+    restored = journal is not None and wallet_state.attach_journal(journal)
     
-    # Connect to A2A network
-    await a2a_client.connect()
-    await message_handler.start_heartbeat_system()
+    wallet_pool = None
+    if WALLET_POOL_SIZE > 1:
+        from syndicate.wallet_pool import WalletPool
+        # The primary wallet acts as treasury for the trading accounts
+        wallet_pool = WalletPool(rpc_manager, treasury_address=wallet_address)
+        await profiler.run_phase("wallet_pool", lambda: asyncio.to_thread(wallet_pool.load))
+        if journal:
+            wallet_pool.attach_journal(journal)
+        for pooled in wallet_pool.wallets:
+            wallet_state.add_address(pooled.address)
+            wallet_monitor.add_address(pooled.address)
+        wallet_pool.start_rebalancer(executor)
+    if not restored:
+        # With journaled balances the background reconcile in start() is enough
+        await profiler.run_phase("wallet_state", wallet_state.reconcile)
+    wallet_state.start()
+    if journal:
+        wallet_state.resume_pending()
+        journal.start()
     
     # Register risk handler
     risk_manager.register_external_advice_handler(
@@ -65,7 +139,11 @@ async def main():
     logger.info_monad(f"Monad track: Resilient Guardian operational on {NETWORK}")
     logger.info_a2a("A2A track: Social Intelligence online")
     logger.info_monad(f"NadFun integration: Ready for token trading and creation")
-    logger.info_monad(f"Wallet: {wallet_manager.get_wallet_address()[:8]}...{wallet_manager.get_wallet_address()[-6:]}")
+    logger.info_monad(f"Wallet: {wallet_address[:8]}...{wallet_address[-6:]}")
+    if executor.dry_run:
+        logger.warning("DRY_RUN enabled: trades are simulated with eth_call, never sent")
+    if STARTUP_REPORT:
+        profiler.log_report()
     
     # Main loop - keep running
     try:
@@ -83,16 +161,25 @@ async def main():
             
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
-        await cleanup(rpc_manager, a2a_client, wallet_manager)
+        await cleanup(rpc_manager, a2a_client, wallet_manager, recorder, journal)
 
-async def cleanup(rpc_manager, a2a_client, wallet_manager):
+async def cleanup(rpc_manager, a2a_client, wallet_manager, recorder=None, journal=None):
     """Cleanup resources"""
     logger.info("Performing cleanup...")
+    if recorder:
+        recorder.close()
+    if journal:
+        await journal.close()
     await rpc_manager.close_session()
     await a2a_client.close_connection()
+    wallet_manager.close()
     sys.exit(0)
 
 if __name__ == "__main__":
-    # Handle graceful shutdown
-    signal.signal(signal.SIGINT, lambda s, f: asyncio.create_task(cleanup(None, None, None)))
-    asyncio.run(main())
+    if RUNTIME_MODE == "multiprocess":
+        from runtime import run_multiprocess
+        run_multiprocess()
+    else:
+        # Handle graceful shutdown
+        signal.signal(signal.SIGINT, lambda s, f: asyncio.create_task(cleanup(None, None, None)))
+        asyncio.run(main())
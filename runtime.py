@@ -0,0 +1,247 @@
+"""Multi-process runtime for Syndicate agent"""
+
+import asyncio
+import importlib
+import multiprocessing
+import signal
+import time
+from typing import Any, Callable, Dict, List, Optional
+from core.logger import logger
+from core.shared_state import SharedRingBuffer, SharedSnapshot
+from config.settings import (
+    NETWORK, NADFUN_CONTRACTS, RUNTIME_RING_BYTES, RUNTIME_SNAPSHOT_BYTES, RUNTIME_STRATEGY,
+    RUNTIME_INGEST_INTERVAL, RUNTIME_MAX_RESTARTS
+)
+
+# Each ring has exactly one producer and one consumer role
+RINGS = {
+    "market_events": ("ingest", "strategy"),
+    "alerts": ("a2a", "strategy"),
+    "orders": ("strategy", "execution"),
+    "fills": ("execution", "strategy"),
+}
+# Latest-value state: one publisher, any number of readers
+SNAPSHOTS = {
+    "risk_params": "a2a",
+    "curve_state": "ingest",
+}
+ROLES = ("ingest", "a2a", "strategy", "execution")
+
+class Channels:
+    """The rings and snapshots of one runtime, created by the supervisor and attached by workers"""
+
+    def __init__(self, names: Optional[Dict[str, str]] = None):
+        create = names is None
+        self.rings = {
+            ring: SharedRingBuffer(None if create else names[ring], RUNTIME_RING_BYTES, create)
+            for ring in RINGS
+        }
+        self.snapshots = {
+            snapshot: SharedSnapshot(None if create else names[snapshot], RUNTIME_SNAPSHOT_BYTES, create)
+            for snapshot in SNAPSHOTS
+        }
+
+    @property
+    def names(self) -> Dict[str, str]:
+        names = {ring: r.name for ring, r in self.rings.items()}
+        names.update({snapshot: s.name for snapshot, s in self.snapshots.items()})
+        return names
+
+    def close(self):
+        for channel in list(self.rings.values()) + list(self.snapshots.values()):
+            channel.close()
+
+# Workers
+
+async def run_ingest(channels: Channels):
+    """Poll NadFun curve logs, decode them here and publish events plus per-token curve state"""
+    from main import start_rpc
+    from syndicate.log_decoder import LogDecoder
+    rpc_manager = await start_rpc()
+    decoder = LogDecoder(contracts=["Curve"])
+    curve_address = NADFUN_CONTRACTS[NETWORK]["CURVE"]
+    events, curve_state = channels.rings["market_events"], channels.snapshots["curve_state"]
+    curves: Dict[str, Dict[str, Any]] = {}
+    last_block = None
+
+    while True:
+        try:
+            latest = int((await rpc_manager.call_rpc("eth_blockNumber", []))["result"], 16)
+            if last_block is not None and latest > last_block:
+                response = await rpc_manager.call_rpc("eth_getLogs", [{
+                    "address": curve_address,
+                    "fromBlock": hex(last_block + 1),
+                    "toBlock": hex(min(latest, last_block + 1000)),
+                }])
+                decoded = decoder.decode_page(response.get("result", []))
+                for name, group in decoded.items():
+                    rows = {column: values.tolist() for column, values in group.columns.items()}
+                    await events.put_async({"event": name, "rows": rows})
+                sync = decoded.get("CurveSync")
+                if sync is not None:
+                    for i, token in enumerate(sync.columns["token"].tolist()):
+                        curves[token] = {
+                            "block": int(sync.columns["block_number"][i]),
+                            "real_mon": float(sync.columns["realMonReserve"][i]),
+                            "real_token": float(sync.columns["realTokenReserve"][i]),
+                            "virtual_mon": float(sync.columns["virtualMonReserve"][i]),
+                            "virtual_token": float(sync.columns["virtualTokenReserve"][i]),
+                        }
+                    curve_state.publish(curves)
+                latest = min(latest, last_block + 1000)
+            last_block = latest
+        except Exception as e:
+            logger.error_blockchain(f"Ingest worker poll failed: {e}")
+        await asyncio.sleep(RUNTIME_INGEST_INTERVAL)
+
+async def run_a2a(channels: Channels):
+    """Own the A2A socket and risk manager; publish risk parameters and forward alerts"""
+    from main import start_a2a
+    a2a_client, risk_manager, message_handler = await start_a2a()
+    risk_params, alerts = channels.snapshots["risk_params"], channels.rings["alerts"]
+    risk_params.publish(risk_manager.get_adjusted_risk_parameters())
+
+    async def _publish(params: Dict[str, Any]):
+        risk_params.publish(dict(params))
+
+    async def _on_alert(payload: Dict[str, Any]):
+        await risk_manager.process_external_risk_advice(payload)
+        if not alerts.put(payload):
+            logger.warn_risk("Strategy worker is behind - dropped an A2A alert")
+
+    risk_manager.register_external_advice_handler(_publish)
+    a2a_client.risk_callback = _on_alert
+    while True:
+        await asyncio.sleep(3600)
+
+def _load_strategy() -> Optional[Callable]:
+    """RUNTIME_STRATEGY names a `module:function` taking (message, context) and returning orders"""
+    if not RUNTIME_STRATEGY:
+        return None
+    module_name, function_name = RUNTIME_STRATEGY.split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+async def run_strategy(channels: Channels):
+    """Consume market events, alerts and fills; turn them into orders for the execution worker"""
+    strategy = _load_strategy()
+    inputs = [channels.rings["market_events"], channels.rings["alerts"], channels.rings["fills"]]
+    orders = channels.rings["orders"]
+    risk_params, curve_state = channels.snapshots["risk_params"], channels.snapshots["curve_state"]
+    processed, last_report = 0, time.monotonic()
+    if strategy is None:
+        logger.warning("No RUNTIME_STRATEGY configured - strategy worker will only observe")
+
+    delay = 0.0001
+    while True:
+        batch = [message for ring in inputs for message in iter(ring.get, None)]
+        if not batch:
+            await asyncio.sleep(delay)
+            delay = min(0.005, delay * 2)
+            continue
+        delay = 0.0001
+        context = {"risk_params": risk_params.read({}), "curve_state": curve_state.read({})}
+        for message in batch:
+            processed += 1
+            if strategy is None:
+                continue
+            try:
+                for order in strategy(message, context) or []:
+                    await orders.put_async(order)
+            except Exception as e:
+                logger.error(f"Strategy failed on {message.get('event', 'message')}: {e}")
+        if time.monotonic() - last_report > 60:
+            logger.info(f"Strategy worker processed {processed} messages")
+            last_report = time.monotonic()
+
+async def run_execution(channels: Channels):
+    """Hold the wallet and submit orders; nothing else runs on this loop"""
+    from main import load_wallet, start_rpc
+    from syndicate.blockchain_integration import CostAwareExecutor
+    from syndicate.wallet_state import WalletStateTracker
+    (wallet_manager, wallet_data), rpc_manager = await asyncio.gather(
+        asyncio.to_thread(load_wallet), start_rpc()
+    )
+    executor = CostAwareExecutor(rpc_manager, NETWORK)
+    wallet_state = WalletStateTracker(rpc_manager, [wallet_data["address"]])
+    executor.wallet_state = wallet_state
+    executor.wallet_address = wallet_data["address"]
+    await wallet_state.reconcile()
+    wallet_state.start()
+    orders, fills = channels.rings["orders"], channels.rings["fills"]
+    risk_params = channels.snapshots["risk_params"]
+
+    while True:
+        order = await orders.get_async()
+        params = risk_params.read({})
+        balance_wei = wallet_state.native_balance_wei(wallet_data["address"])
+        max_trade = params.get("max_trade_size")
+        if max_trade is not None and order.get("amount_in", 0) > balance_wei * max_trade:
+            result = {"status": "rejected", "reason": "risk_max_trade_size"}
+        elif order.get("action") == "buy":
+            result = await executor.buy_token(order["token"], order["amount_in"], order.get("slippage", 0.005))
+        else:
+            result = {"status": "rejected", "reason": f"unsupported action {order.get('action')}"}
+        await fills.put_async({"event": "fill", "order": order, "result": result})
+
+WORKERS = {
+    "ingest": run_ingest,
+    "a2a": run_a2a,
+    "strategy": run_strategy,
+    "execution": run_execution,
+}
+
+def _worker_main(role: str, names: Dict[str, str]):
+    """Process entry point: attach to the shared channels and run the role's loop"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles Ctrl-C
+    channels = Channels(names)
+    try:
+        asyncio.run(WORKERS[role](channels))
+    finally:
+        channels.close()
+
+# Supervisor
+
+def run_multiprocess(roles: List[str] = list(ROLES)):
+    """Create the shared channels, start one process per role and restart any that die"""
+    context = multiprocessing.get_context("spawn")
+    channels = Channels()
+    processes: Dict[str, multiprocessing.Process] = {}
+    restarts = {role: 0 for role in roles}
+    stopping = False
+
+    def _start(role: str):
+        process = context.Process(target=_worker_main, args=(role, channels.names), name=f"syndicate-{role}")
+        process.start()
+        processes[role] = process
+        logger.info(f"Started {role} worker (pid {process.pid})")
+
+    def _stop(*_):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+    logger.success(f"🚀 Starting Syndicate multi-process runtime: {', '.join(roles)}")
+    try:
+        for role in roles:
+            _start(role)
+        while not stopping:
+            time.sleep(0.5)
+            for role, process in processes.items():
+                if process.is_alive() or stopping:
+                    continue
+                if restarts[role] >= RUNTIME_MAX_RESTARTS:
+                    logger.critical(f"{role} worker keeps dying (exit {process.exitcode}) - shutting down")
+                    stopping = True
+                    break
+                restarts[role] += 1
+                logger.warn_risk(f"{role} worker exited with {process.exitcode} - restarting")
+                _start(role)
+    finally:
+        logger.info("Stopping workers...")
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join(timeout=5)
+        channels.close()
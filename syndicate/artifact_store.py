@@ -0,0 +1,214 @@
+"""Indexed ABI/artifact registry for Foundry outputs"""
+
+import json
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..core.logger import logger
+from ..utils.abi import (
+    canonical_type, decode_abi, encode_abi, event_topic, function_selector
+)
+
+INDEX_FORMAT_VERSION = 1
+
+@dataclass
+class FunctionEntry:
+    contract: str
+    name: str
+    signature: str
+    selector: str
+    input_types: Tuple[str, ...]
+    output_types: Tuple[str, ...]
+
+    def encode_call(self, args: Sequence[Any]) -> str:
+        """0x-hex calldata for this function"""
+        return self.selector + encode_abi(self.input_types, args).hex()
+
+    def decode_output(self, data) -> Tuple[Any, ...]:
+        return decode_abi(self.output_types, data)
+
+@dataclass
+class EventEntry:
+    contract: str
+    name: str
+    signature: str
+    topic: str
+    anonymous: bool
+    indexed: Tuple[Tuple[str, str], ...]  # (name, type) of indexed params, in topic order
+    data: Tuple[Tuple[str, str], ...]     # (name, type) of non-indexed params, in data order
+
+@dataclass
+class ContractEntry:
+    name: str
+    abi: List[Dict[str, Any]]
+    compiler_version: Optional[str] = None
+    source: Optional[str] = None
+    functions: Dict[str, List[FunctionEntry]] = field(default_factory=dict)
+    events: Dict[str, EventEntry] = field(default_factory=dict)
+
+def _index_contract(name: str, abi: List[Dict[str, Any]], compiler_version: Optional[str] = None,
+                    source: Optional[str] = None) -> ContractEntry:
+    entry = ContractEntry(name=name, abi=abi, compiler_version=compiler_version, source=source)
+    for item in abi:
+        if item.get("type") == "function":
+            input_types = tuple(canonical_type(p) for p in item.get("inputs", []))
+            signature = f"{item['name']}({','.join(input_types)})"
+            entry.functions.setdefault(item["name"], []).append(FunctionEntry(
+                contract=name,
+                name=item["name"],
+                signature=signature,
+                selector="0x" + function_selector(signature).hex(),
+                input_types=input_types,
+                output_types=tuple(canonical_type(p) for p in item.get("outputs", [])),
+            ))
+        elif item.get("type") == "event":
+            params = item.get("inputs", [])
+            signature = f"{item['name']}({','.join(canonical_type(p) for p in params)})"
+            entry.events[item["name"]] = EventEntry(
+                contract=name,
+                name=item["name"],
+                signature=signature,
+                topic=event_topic(signature),
+                anonymous=item.get("anonymous", False),
+                indexed=tuple((p.get("name", ""), canonical_type(p)) for p in params if p.get("indexed")),
+                data=tuple((p.get("name", ""), canonical_type(p)) for p in params if not p.get("indexed")),
+            )
+    return entry
+
+class ArtifactRegistry:
+    """All contract ABIs indexed once, with O(1) lookups by name, selector and topic.
+
+    Sources are Foundry's `out/` directory and hand-maintained `abis/*.json`
+    files for contracts we don't compile (the NadFun deployments). The parsed
+    index is pickled next to the artifacts and reused for as long as no
+    artifact's mtime or size changes. A warm start therefore skips JSON parsing
+    and keccak hashing entirely.
+    """
+
+    def __init__(self, out_dir: Path = Path("out"), abi_dir: Path = Path("abis"),
+                 cache_path: Optional[Path] = None):
+        self.out_dir = Path(out_dir)
+        self.abi_dir = Path(abi_dir)
+        self.cache_path = cache_path or Path(".syndicate-cache") / "abi-index.pkl"
+        self.contracts: Dict[str, ContractEntry] = {}
+        self.selectors: Dict[str, List[FunctionEntry]] = {}
+        self.topics: Dict[str, EventEntry] = {}
+        self.loaded = False
+
+    def _artifact_files(self) -> List[Path]:
+        files = []
+        if self.out_dir.is_dir():
+            files.extend(p for p in self.out_dir.glob("*.sol/*.json"))
+        if self.abi_dir.is_dir():
+            files.extend(self.abi_dir.glob("*.json"))
+        return sorted(files)
+
+    def _fingerprint(self, files: List[Path]) -> Tuple:
+        stamps = []
+        for path in files:
+            stat = path.stat()
+            stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return (INDEX_FORMAT_VERSION, tuple(stamps))
+
+    def load(self) -> "ArtifactRegistry":
+        """Build the index, reusing the pickled copy when artifacts are unchanged"""
+        files = self._artifact_files()
+        fingerprint = self._fingerprint(files)
+        if self.cache_path.is_file():
+            try:
+                with open(self.cache_path, "rb") as f:
+                    cached = pickle.load(f)
+                if cached.get("fingerprint") == fingerprint:
+                    self.contracts = cached["contracts"]
+                    self._build_lookups()
+                    self.loaded = True
+                    return self
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable ABI index cache: {e}")
+
+        self.contracts = {}
+        for path in files:
+            try:
+                self._index_file(path)
+            except Exception as e:
+                logger.warning(f"Skipping artifact {path}: {e}")
+        self._build_lookups()
+        self.loaded = True
+        self._save(fingerprint)
+        return self
+
+    def _index_file(self, path: Path):
+        with open(path, "r") as f:
+            document = json.load(f)
+        if isinstance(document, list):  # bare ABI file
+            abi, metadata = document, {}
+        else:
+            abi, metadata = document.get("abi", []), document.get("metadata") or {}
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        compiler_version = metadata.get("compiler", {}).get("version")
+        targets = metadata.get("settings", {}).get("compilationTarget", {})
+        source = next(iter(targets), None)
+        self.contracts[path.stem] = _index_contract(path.stem, abi, compiler_version, source)
+
+    def _build_lookups(self):
+        self.selectors = {}
+        self.topics = {}
+        for contract in self.contracts.values():
+            for overloads in contract.functions.values():
+                for fn in overloads:
+                    self.selectors.setdefault(fn.selector, []).append(fn)
+            for event in contract.events.values():
+                self.topics.setdefault(event.topic, event)
+
+    def _save(self, fingerprint: Tuple):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"fingerprint": fingerprint, "contracts": self.contracts}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write ABI index cache: {e}")
+
+    def register_abi(self, name: str, abi: List[Dict[str, Any]]):
+        """Add an ABI that isn't on disk (e.g. fetched from an explorer)"""
+        self.contracts[name] = _index_contract(name, abi)
+        self._build_lookups()
+
+    # Lookups
+    def abi(self, contract: str) -> List[Dict[str, Any]]:
+        entry = self.contracts.get(contract)
+        return entry.abi if entry else []
+
+    def function(self, contract: str, name: str) -> Optional[FunctionEntry]:
+        """First overload of contract.name"""
+        entry = self.contracts.get(contract)
+        overloads = entry.functions.get(name) if entry else None
+        return overloads[0] if overloads else None
+
+    def functions_by_selector(self, selector: str) -> List[FunctionEntry]:
+        return self.selectors.get(selector.lower(), [])
+
+    def event(self, contract: str, name: str) -> Optional[EventEntry]:
+        entry = self.contracts.get(contract)
+        return entry.events.get(name) if entry else None
+
+    def event_by_topic(self, topic: str) -> Optional[EventEntry]:
+        return self.topics.get(topic.lower())
+
+    def compiler_version(self, contract: str) -> Optional[str]:
+        entry = self.contracts.get(contract)
+        return entry.compiler_version if entry else None
+
+_registry: Optional[ArtifactRegistry] = None
+
+def get_artifact_registry() -> ArtifactRegistry:
+    """Process-wide registry, indexed on first use"""
+    global _registry
+    if _registry is None:
+        _registry = ArtifactRegistry().load()
+    return _registry
@@ -0,0 +1,188 @@
+"""Historical log backfill with parallel block-range sharding"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .log_decoder import LogDecoder
+from .rpc_manager import DynamicFailoverManager, RPCEndpoint
+from ..core.logger import logger
+
+# Substrings providers use when a getLogs range returns too much
+_RANGE_TOO_LARGE = (
+    "too many", "limit", "exceed", "range", "response size", "query timeout", "10000 results"
+)
+
+class RangeTooLarge(Exception):
+    pass
+
+@dataclass
+class BackfillShard:
+    start: int
+    end: int  # inclusive
+
+    @property
+    def key(self) -> str:
+        return f"{self.start}_{self.end}"
+
+class BackfillEngine:
+    """Fetch, decode and store logs for a block range across every RPC endpoint.
+
+    The range is cut into fixed shards that workers pull from a queue. Each
+    worker is pinned to one endpoint, so all providers share the load. Within
+    a shard a worker walks eth_getLogs windows whose size adapts: doubled
+    after a small page, halved when the provider says the window returned too
+    much. Each finished shard is written as a compressed .npz of decoded
+    columns and recorded in checkpoint.json, so an interrupted run resumes
+    where it stopped.
+    """
+
+    def __init__(self, rpc_manager: DynamicFailoverManager, decoder: LogDecoder, output_dir: Path,
+                 addresses: Sequence[str], topics: Optional[List[Any]] = None,
+                 shard_size: int = 20_000, initial_window: int = 2_000,
+                 max_window: int = 10_000, target_logs_per_call: int = 5_000,
+                 workers_per_endpoint: int = 2, max_attempts: int = 5):
+        self.rpc_manager = rpc_manager
+        self.decoder = decoder
+        self.output_dir = Path(output_dir)
+        self.addresses = [a.lower() for a in addresses]
+        self.topics = topics
+        self.shard_size = shard_size
+        self.initial_window = initial_window
+        self.max_window = max_window
+        self.target_logs_per_call = target_logs_per_call
+        self.workers_per_endpoint = workers_per_endpoint
+        self.max_attempts = max_attempts
+        self.checkpoint_path = self.output_dir / "checkpoint.json"
+        self.completed: Dict[str, int] = {}
+        self.stats = {"calls": 0, "splits": 0, "logs": 0, "failed_shards": 0}
+
+    # Checkpointing
+    def _job_signature(self) -> Dict[str, Any]:
+        return {"addresses": sorted(self.addresses), "topics": self.topics, "shard_size": self.shard_size}
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_path.is_file():
+            return
+        with open(self.checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("job") == self._job_signature():
+            self.completed = checkpoint.get("completed", {})
+        else:
+            logger.warning("Backfill checkpoint is for a different job - starting over")
+
+    def _save_checkpoint(self):
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"job": self._job_signature(), "completed": self.completed}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # Fetching
+    async def _get_logs(self, endpoint: RPCEndpoint, start: int, end: int) -> List[Dict[str, Any]]:
+        query = {"fromBlock": hex(start), "toBlock": hex(end), "address": self.addresses}
+        if self.topics:
+            query["topics"] = self.topics
+        self.stats["calls"] += 1
+        response = await self.rpc_manager.call_rpc("eth_getLogs", [query], endpoint=endpoint)
+        error = response.get("error")
+        if error:
+            message = str(error.get("message", error)).lower()
+            if any(marker in message for marker in _RANGE_TOO_LARGE):
+                raise RangeTooLarge(message)
+            raise Exception(f"eth_getLogs failed: {message}")
+        return response.get("result", [])
+
+    async def _fetch_shard(self, endpoint: RPCEndpoint, shard: BackfillShard,
+                           window: int) -> Tuple[List[Dict[str, Any]], int]:
+        logs: List[Dict[str, Any]] = []
+        cursor = shard.start
+        while cursor <= shard.end:
+            end = min(shard.end, cursor + window - 1)
+            try:
+                page = await self._get_logs(endpoint, cursor, end)
+            except RangeTooLarge:
+                if window == 1:
+                    raise
+                window = max(1, window // 2)
+                self.stats["splits"] += 1
+                continue
+            logs.extend(page)
+            cursor = end + 1
+            if len(page) < self.target_logs_per_call // 4:
+                window = min(self.max_window, window * 2)
+        return logs, window
+
+    def _write_shard(self, shard: BackfillShard, logs: List[Dict[str, Any]]) -> int:
+        decoded = self.decoder.decode_page(logs)
+        arrays = {}
+        for name, events in decoded.items():
+            for column, values in events.columns.items():
+                arrays[f"{name}__{column}"] = values
+        np.savez_compressed(self.output_dir / f"logs_{shard.key}.npz", **arrays)
+        return sum(len(events) for events in decoded.values())
+
+    async def _worker(self, endpoint: RPCEndpoint, queue: asyncio.Queue):
+        window = self.initial_window
+        while True:
+            shard, attempt = await queue.get()
+            try:
+                logs, window = await self._fetch_shard(endpoint, shard, window)
+                count = await asyncio.to_thread(self._write_shard, shard, logs)
+                self.completed[shard.key] = count
+                self.stats["logs"] += count
+                self._save_checkpoint()
+            except Exception as e:
+                if attempt + 1 < self.max_attempts:
+                    logger.warning(f"Backfill shard {shard.key} failed on {endpoint.url} ({e}) - requeued")
+                    await asyncio.sleep(min(10, 0.5 * 2 ** attempt))
+                    queue.put_nowait((shard, attempt + 1))
+                else:
+                    logger.error_blockchain(f"Backfill shard {shard.key} gave up: {e}")
+                    self.stats["failed_shards"] += 1
+            finally:
+                queue.task_done()
+
+    async def run(self, from_block: int, to_block: int) -> Dict[str, Any]:
+        """Backfill [from_block, to_block]; safe to call again after an interruption"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._load_checkpoint()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        pending = 0
+        for start in range(from_block, to_block + 1, self.shard_size):
+            shard = BackfillShard(start, min(to_block, start + self.shard_size - 1))
+            if shard.key not in self.completed:
+                queue.put_nowait((shard, 0))
+                pending += 1
+        logger.info_monad(f"Backfill {from_block}-{to_block}: {pending} shards to fetch, "
+                          f"{len(self.completed)} already done")
+
+        endpoints = [e for e in self.rpc_manager.endpoints if e.chain_id_ok]
+        workers = [
+            asyncio.create_task(self._worker(endpoint, queue))
+            for endpoint in endpoints
+            for _ in range(self.workers_per_endpoint)
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+        logger.success(f"Backfill complete: {self.stats['logs']} events in {self.stats['calls']} calls")
+        return dict(self.stats, shards_done=len(self.completed))
+
+def load_backfill(output_dir: Path) -> Dict[str, Dict[str, np.ndarray]]:
+    """Concatenate every stored shard into {event: {column: array}}, ordered by block"""
+    merged: Dict[str, Dict[str, List[np.ndarray]]] = {}
+    for path in sorted(Path(output_dir).glob("logs_*.npz"), key=lambda p: int(p.stem.split("_")[1])):
+        with np.load(path, allow_pickle=True) as shard:
+            for key in shard.files:
+                event, column = key.split("__", 1)
+                merged.setdefault(event, {}).setdefault(column, []).append(shard[key])
+    return {
+        event: {column: np.concatenate(parts) for column, parts in columns.items()}
+        for event, columns in merged.items()
+    }
@@ -2,33 +2,37 @@
 
 import asyncio
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 from .rpc_manager import DynamicFailoverManager
+from .clients import get_public_client
+from .artifact_store import get_artifact_registry
+from .simulator import SimulationResult, TradeSimulator
 from ..core.logger import logger
-from ..config.settings import MAX_TRADE_SIZE_PERCENTAGE, NADFUN_CONTRACTS, NETWORK
-from viem import create_public_client, create_wallet_client, http, get_contract
-from viem.types import Address
-from viem.utils import parse_ether, format_ether
+from ..config.settings import DRY_RUN, MAX_TRADE_SIZE_PERCENTAGE, NADFUN_CONTRACTS, NETWORK
+
+Address = str  # same alias as viem.types.Address, without importing viem at load time
 
 class CostAwareExecutor:
-    def __init__(self, rpc_manager: DynamicFailoverManager, network: str = "testnet"):
+    def __init__(self, rpc_manager: DynamicFailoverManager, network: str = "testnet",
+                 public_client: Optional[Any] = None):
         self.rpc_manager = rpc_manager
         self.network = network
         self.config = NADFUN_CONTRACTS[network]
         self.gas_price_cache = {}
+        self._public_client = public_client
+        self.wallet_state = None  # optional WalletStateTracker for zero-RPC balance checks
+        self.wallet_address = None
+        self.simulator = TradeSimulator(rpc_manager)
+        self.dry_run = DRY_RUN  # simulate instead of sending
+    
+    @property
+    def public_client(self):
+        """Shared viem public client, built on first contract read"""
+        if self._public_client is None:
+            self._public_client = get_public_client(self.network)
+        return self._public_client
         
-        # Initialize viem clients with proper Monad chain config
-        self.public_client = create_public_client({
-            "chain": {
-                "id": self.config["chainId"],
-                "name": "Monad",
-                "nativeCurrency": {"name": "MON", "symbol": "MON", "decimals": 18},
-                "rpcUrls": {"default": {"http": [self.config["rpcUrl"]]}},
-            },
-            "transport": http(self.config["rpcUrl"]),
-        })
-        
-    async def estimate_gas_cost(self, transaction_ Dict[str, Any]) -> Decimal:
+    async def estimate_gas_cost(self, transaction_data: Dict[str, Any]) -> Decimal:
         """Simulate gas cost before execution"""
         try:
             gas_price_result = await self.rpc_manager.call_rpc(
@@ -55,8 +59,11 @@ class CostAwareExecutor:
             logger.error_blockchain(f"Gas estimation failed: {e}")
             return Decimal("0")
     
-    async def execute_transaction_with_priority(self, transaction_ Dict[str, Any], priority: str = "normal"):
+    async def execute_transaction_with_priority(self, transaction_data: Dict[str, Any], priority: str = "normal"):
         """Execute transaction with cost awareness and priority handling"""
+        if self.dry_run:
+            return await self.dry_run_transaction(transaction_data)
+        
         estimated_cost = await self.estimate_gas_cost(transaction_data)
         
         if priority == "high":
@@ -64,8 +71,8 @@ class CostAwareExecutor:
         elif priority == "low":
             transaction_data["gasPrice"] = hex(int(self.gas_price_cache["last_estimate"]["gas_price"] * 0.8))
         
-        wallet_balance = await self.get_wallet_balance()
-        if estimated_cost > wallet_balance * MAX_TRADE_SIZE_PERCENTAGE:
+        wallet_balance = await self.get_wallet_balance(transaction_data.get("from"))
+        if estimated_cost > wallet_balance * Decimal(str(MAX_TRADE_SIZE_PERCENTAGE)):
             logger.warning(f"Transaction too expensive: {estimated_cost} vs {wallet_balance}")
             return {"status": "rejected", "reason": "cost_too_high"}
         
@@ -74,15 +81,46 @@ class CostAwareExecutor:
                 "eth_sendTransaction", [transaction_data]
             )
             logger.success(f"Transaction executed: {result['result']}")
+            if self.wallet_state:
+                asyncio.create_task(self.wallet_state.track_transaction(result["result"], transaction_data))
             return {"status": "success", "tx_hash": result["result"]}
         except Exception as e:
             logger.error_blockchain(f"Transaction failed: {e}")
             return {"status": "failed", "error": str(e)}
     
-    async def get_wallet_balance(self) -> Decimal:
-        """Get current wallet balance"""
-        # Implementation would go here
-        return Decimal("10.0")  # Placeholder
+    async def dry_run_transaction(self, transaction_data: Dict[str, Any],
+                                  state_override: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Simulate a transaction at the latest block without sending it"""
+        if self.wallet_address and "from" not in transaction_data:
+            transaction_data = dict(transaction_data, **{"from": self.wallet_address})
+        result = await self.simulator.simulate(transaction_data, state_override)
+        if result.success:
+            logger.info_monad(f"Dry run OK at block {result.block}: gas {result.gas_used}")
+            return {"status": "simulated", "block": result.block, "gas_used": result.gas_used,
+                    "return_data": result.return_data}
+        logger.warning(f"Dry run reverted at block {result.block}: {result.revert_reason}")
+        return {"status": "reverted", "block": result.block, "reason": result.revert_reason}
+    
+    async def simulate_trades(self, transactions: List[Dict[str, Any]],
+                              state_overrides: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+                              output_types: Optional[Sequence[Optional[Sequence[str]]]] = None
+                              ) -> List[SimulationResult]:
+        """Evaluate candidate trades against the same block in one batched round trip"""
+        if self.wallet_address:
+            transactions = [
+                tx if "from" in tx else dict(tx, **{"from": self.wallet_address}) for tx in transactions
+            ]
+        return await self.simulator.simulate_batch(transactions, state_overrides, output_types)
+    
+    async def get_wallet_balance(self, address: Optional[str] = None) -> Decimal:
+        """Get current wallet balance in MON (an in-memory read when tracking is enabled)"""
+        address = address or self.wallet_address
+        if self.wallet_state and address:
+            return self.wallet_state.native_balance(address)
+        if address:
+            result = await self.rpc_manager.call_rpc("eth_getBalance", [address, "latest"])
+            return Decimal(int(result["result"], 16)) / Decimal(10**18)
+        return Decimal("10.0")  # Placeholder until a wallet address is attached
     
     # NadFun specific methods
     async def get_token_quote(self, token_address: str, amount_in: int, is_buy: bool) -> tuple[Address, int]:
@@ -156,10 +194,8 @@ class CostAwareExecutor:
     
     def _get_lens_abi(self):
         """Get LENS contract ABI"""
-        # This would be imported from abis/lens.py
-        return []  # Placeholder
+        return get_artifact_registry().abi("Lens")
     
     def _get_curve_abi(self):
         """Get Curve contract ABI"""
-        # This would be imported from abis/curve.py
-        return []  # Placeholder
+        return get_artifact_registry().abi("Curve")
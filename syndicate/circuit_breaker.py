@@ -0,0 +1,60 @@
+"""Per-endpoint circuit breaker for Syndicate agent"""
+
+import time
+from typing import Optional
+from enum import Enum
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0,
+                 half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self.open_duration = recovery_timeout
+        self.half_open_calls = 0
+
+    @property
+    def retry_at(self) -> float:
+        """Monotonic time at which an open breaker lets a trial call through"""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return self.opened_at + self.open_duration
+
+    def allow_request(self) -> bool:
+        """Whether a call may be sent now; moves OPEN to HALF_OPEN after the timeout"""
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() < self.retry_at:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self.half_open_calls = 0
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                return False
+            self.half_open_calls += 1
+        return True
+
+    def record_success(self):
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.half_open_calls = 0
+
+    def record_failure(self):
+        self.failure_count += 1
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.trip()
+
+    def trip(self, duration: Optional[float] = None):
+        """Open the breaker for `duration` seconds (default: recovery_timeout)"""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.open_duration = duration if duration is not None else self.recovery_timeout
+        self.half_open_calls = 0
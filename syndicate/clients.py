@@ -0,0 +1,36 @@
+"""Shared blockchain client construction for Syndicate agent"""
+
+from typing import Dict, Optional, Tuple
+from ..config.settings import NADFUN_CONTRACTS
+
+_public_clients: Dict[Tuple[str, str], object] = {}
+
+def build_chain_config(network: str, rpc_url: Optional[str] = None) -> Dict:
+    """Build the viem chain definition for a Monad network"""
+    config = NADFUN_CONTRACTS[network]
+    url = rpc_url or config["rpcUrl"]
+    return {
+        "id": config["chainId"],
+        "name": "Monad",
+        "nativeCurrency": {"name": "MON", "symbol": "MON", "decimals": 18},
+        "rpcUrls": {"default": {"http": [url]}},
+    }
+
+def get_public_client(network: str = "testnet", rpc_url: Optional[str] = None):
+    """Return the process-wide viem public client for a network, creating it once"""
+    url = rpc_url or NADFUN_CONTRACTS[network]["rpcUrl"]
+    key = (network, url)
+    client = _public_clients.get(key)
+    if client is None:
+        # viem is only imported when the first client is actually needed
+        from viem import create_public_client, http
+        client = create_public_client({
+            "chain": build_chain_config(network, url),
+            "transport": http(url),
+        })
+        _public_clients[key] = client
+    return client
+
+def reset_public_clients():
+    """Drop cached clients (used after a network switch or in benchmarks)"""
+    _public_clients.clear()
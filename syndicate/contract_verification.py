@@ -1,20 +1,77 @@
 """Contract verification for Syndicate agent"""
 
+import asyncio
+import hashlib
 import json
 import subprocess
 import aiohttp
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 from ..core.logger import logger
-from ..config.settings import NETWORK, NADFUN_CONTRACTS
+from ..config.settings import NETWORK, NADFUN_CONTRACTS, VERIFY_CONCURRENCY, VERIFY_RETRIES
+from ..utils.abi import encode_abi, parse_cli_value, signature_types
+from .artifact_store import get_artifact_registry
+
+@dataclass
+class ContractSpec:
+    address: str
+    contract_path: str
+    contract_name: str
+    constructor_signature: Optional[str] = None
+    constructor_args: Sequence = field(default_factory=tuple)
 
 class ContractVerifier:
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None, concurrency: int = VERIFY_CONCURRENCY):
         self.config = NADFUN_CONTRACTS[NETWORK]
         self.chain_id = self.config["chainId"]
+        self.cache_dir = cache_dir or Path(".syndicate-cache") / "verification"
+        self.concurrency = concurrency
+        self._standard_json_cache: Dict[str, dict] = {}
+        self._artifact_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+        self._subprocess_slots = None
+    
+    def _source_hash(self, contract_path: str, contract_name: str) -> str:
+        """Content hash of everything the standard JSON input depends on"""
+        digest = hashlib.sha256(f"{self.chain_id}:{contract_path}:{contract_name}".encode())
+        sources = {contract_path.split(":")[0], contract_name.split(":")[0], "foundry.toml"}
+        for candidate in map(Path, sorted(sources)):
+            if candidate.is_file():
+                digest.update(candidate.read_bytes())
+        return digest.hexdigest()
+    
+    def _cached_standard_json(self, key: str) -> Optional[dict]:
+        if key in self._standard_json_cache:
+            return self._standard_json_cache[key]
+        cache_file = self.cache_dir / f"{key}.json"
+        if cache_file.is_file():
+            with open(cache_file, 'r') as f:
+                self._standard_json_cache[key] = json.load(f)
+            return self._standard_json_cache[key]
+        return None
+    
+    def _store_standard_json(self, key: str, standard_json: dict):
+        self._standard_json_cache[key] = standard_json
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{key}.json", 'w') as f:
+                json.dump(standard_json, f)
+        except OSError as e:
+            logger.warning(f"Could not persist verification cache: {e}")
+    
+    def _forge_command(self, contract_path: str, contract_name: str) -> List[str]:
+        return [
+            "forge", "verify-contract",
+            contract_path,
+            contract_name,
+            "--chain", str(self.chain_id),
+            "--show-standard-json-input"
+        ]
     
     async def verify_contract(self, contract_address: str, contract_name: str, 
                             compiler_version: str, standard_json_input: dict,
-                            constructor_args: str = None) -> bool:
+                            constructor_args: str = None,
+                            session: Optional[aiohttp.ClientSession] = None) -> bool:
         """Verify contract using the verification API"""
         try:
             # Prepare verification payload
@@ -30,8 +87,10 @@ class ContractVerifier:
                 # Remove 0x prefix if present
                 payload["constructorArgs"] = constructor_args.replace("0x", "")
             
-            # Call verification API
-            async with aiohttp.ClientSession() as session:
+            # Call verification API (reusing the batch session when given one)
+            owns_session = session is None
+            session = session or aiohttp.ClientSession()
+            try:
                 async with session.post(
                     "https://agents.devnads.com/v1/verify",
                     headers={"Content-Type": "application/json"},
@@ -45,6 +104,9 @@ class ContractVerifier:
                     else:
                         logger.error(f"Verification API failed: {response.status}")
                         return False
+            finally:
+                if owns_session:
+                    await session.close()
                         
         except Exception as e:
             logger.error(f"Contract verification error: {e}")
@@ -53,19 +115,19 @@ class ContractVerifier:
     def get_standard_json_input(self, contract_path: str, contract_name: str) -> dict:
         """Get standard JSON input for verification using forge command"""
         try:
-            # Run forge verify-contract to get standard JSON input
-            cmd = [
-                "forge", "verify-contract",
-                contract_path,
-                contract_name,
-                "--chain", str(self.chain_id),
-                "--show-standard-json-input"
-            ]
+            key = self._source_hash(contract_path, contract_name)
+            cached = self._cached_standard_json(key)
+            if cached is not None:
+                return cached
             
+            # Run forge verify-contract to get standard JSON input
+            cmd = self._forge_command(contract_path, contract_name)
             result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path.cwd())
             
             if result.returncode == 0:
-                return json.loads(result.stdout.strip())
+                standard_json = json.loads(result.stdout.strip())
+                self._store_standard_json(key, standard_json)
+                return standard_json
             else:
                 logger.error(f"Forge command failed: {result.stderr}")
                 return None
@@ -74,15 +136,63 @@ class ContractVerifier:
             logger.error(f"Error getting standard JSON input: {e}")
             return None
     
+    async def get_standard_json_input_async(self, contract_path: str, contract_name: str) -> dict:
+        """Non-blocking get_standard_json_input: forge runs as a limited-concurrency subprocess"""
+        try:
+            key = await asyncio.to_thread(self._source_hash, contract_path, contract_name)
+            cached = self._cached_standard_json(key)
+            if cached is not None:
+                return cached
+            
+            if self._subprocess_slots is None:
+                self._subprocess_slots = asyncio.Semaphore(self.concurrency)
+            async with self._subprocess_slots:
+                process = await asyncio.create_subprocess_exec(
+                    *self._forge_command(contract_path, contract_name),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=Path.cwd()
+                )
+                stdout, stderr = await process.communicate()
+            
+            if process.returncode == 0:
+                standard_json = json.loads(stdout.decode().strip())
+                self._store_standard_json(key, standard_json)
+                return standard_json
+            else:
+                logger.error(f"Forge command failed: {stderr.decode()}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error getting standard JSON input: {e}")
+            return None
+    
+    def _load_artifact(self, artifact_path: Path) -> Optional[dict]:
+        """Parse an artifact once per (mtime, size); later calls hit the cache"""
+        stat = artifact_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._artifact_cache.get(str(artifact_path))
+        if cached and cached[0] == stamp:
+            return cached[1]
+        with open(artifact_path, 'r') as f:
+            artifact = json.load(f)
+        # Only metadata is needed for verification; don't keep bytecode around
+        self._artifact_cache[str(artifact_path)] = (stamp, {"metadata": artifact.get("metadata", {})})
+        return self._artifact_cache[str(artifact_path)][1]
+    
     def get_compiler_version(self, contract_path: str, contract_name: str) -> str:
         """Extract compiler version from contract artifact"""
         try:
+            # The shared registry has already parsed every artifact in out/
+            indexed_version = get_artifact_registry().compiler_version(contract_name.split(':')[-1])
+            if indexed_version:
+                return indexed_version
+            
             # Look for the contract artifact
             artifact_path = Path(f"out/{contract_name.split(':')[-1]}.sol/{contract_name.split(':')[-1]}.json")
             
             if artifact_path.exists():
-                with open(artifact_path, 'r') as f:
-                    artifact = json.load(f)
+                artifact = self._load_artifact(artifact_path)
                 
                 compiler_version = artifact.get('metadata', {}).get('compiler', {}).get('version', '0.8.27')
                 return compiler_version
@@ -95,19 +205,51 @@ class ContractVerifier:
             return "0.8.27"
     
     def encode_constructor_args(self, constructor_signature: str, *args) -> str:
-        """Encode constructor arguments using cast"""
+        """Encode constructor arguments in-process (same output as `cast abi-encode`)"""
         try:
-            # Use cast to encode constructor arguments
-            cmd = ["cast", "abi-encode", constructor_signature] + [str(arg) for arg in args]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                encoded_args = result.stdout.strip()
-                return encoded_args.replace("0x", "")  # Remove 0x prefix
-            else:
-                logger.error(f"Cast encode failed: {result.stderr}")
-                return ""
+            types = signature_types(constructor_signature)
+            values = [parse_cli_value(t, arg) for t, arg in zip(types, args)]
+            return encode_abi(types, values).hex()  # No 0x prefix
                 
         except Exception as e:
             logger.error(f"Error encoding constructor args: {e}")
             return ""
+    
+    async def _verify_one(self, spec: ContractSpec, session: aiohttp.ClientSession,
+                          retries: int) -> bool:
+        standard_json = await self.get_standard_json_input_async(spec.contract_path, spec.contract_name)
+        if standard_json is None:
+            return False
+        compiler_version = await asyncio.to_thread(
+            self.get_compiler_version, spec.contract_path, spec.contract_name
+        )
+        constructor_args = None
+        if spec.constructor_signature:
+            constructor_args = self.encode_constructor_args(spec.constructor_signature, *spec.constructor_args)
+        
+        for attempt in range(retries):
+            if await self.verify_contract(spec.address, spec.contract_name, compiler_version,
+                                          standard_json, constructor_args, session=session):
+                return True
+            if attempt < retries - 1:
+                await asyncio.sleep(min(30, 2 ** attempt))
+        return False
+    
+    async def verify_batch(self, contracts: List[ContractSpec],
+                           retries: int = VERIFY_RETRIES) -> Dict[str, bool]:
+        """Verify a whole deployment concurrently; returns address -> verified"""
+        slots = asyncio.Semaphore(self.concurrency)
+        
+        async def _bounded(spec: ContractSpec, session: aiohttp.ClientSession) -> bool:
+            async with slots:
+                return await self._verify_one(spec, session, retries)
+        
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *(_bounded(spec, session) for spec in contracts), return_exceptions=True
+            )
+        outcome = {
+            spec.address: result is True for spec, result in zip(contracts, results)
+        }
+        logger.info(f"Batch verification: {sum(outcome.values())}/{len(contracts)} contracts verified")
+        return outcome
@@ -0,0 +1,99 @@
+"""Keystore v3 (scrypt + AES-128-CTR) encryption for Syndicate wallets"""
+
+import hashlib
+import hmac
+import os
+import uuid
+from typing import Any, Dict, Optional
+from Crypto.Cipher import AES
+from Crypto.Hash import keccak
+from Crypto.Protocol.KDF import scrypt as PyScrypt
+from ..config.settings import KEYSTORE_SCRYPT_N, KEYSTORE_SCRYPT_R, KEYSTORE_SCRYPT_P
+
+class KeystoreError(Exception):
+    pass
+
+def _keccak256(data: bytes) -> bytes:
+    return keccak.new(digest_bits=256, data=data).digest()
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int, dklen: int) -> bytes:
+    # hashlib refuses anything above its 32 MiB default unless maxmem is raised
+    maxmem = 2 * 128 * r * (n + p + 2)
+    try:
+        return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                              maxmem=maxmem, dklen=dklen)
+    except ValueError:
+        # OpenSSL also rejects N >= 2**(16*r), which some r=1 keystores use
+        return PyScrypt(password.encode("utf-8"), salt, dklen, n, r, p)
+
+def is_keystore(data: Dict[str, Any]) -> bool:
+    """Whether a wallet file is keystore v3 rather than legacy plaintext"""
+    return data.get("version") == 3 and "crypto" in data
+
+def encrypt_keystore(private_key: bytes, password: str, address: str,
+                     n: int = KEYSTORE_SCRYPT_N, r: int = KEYSTORE_SCRYPT_R,
+                     p: int = KEYSTORE_SCRYPT_P) -> Dict[str, Any]:
+    """Encrypt a private key into a keystore v3 document"""
+    salt = os.urandom(32)
+    iv = os.urandom(16)
+    derived = _scrypt(password, salt, n, r, p, 32)
+    cipher = AES.new(derived[:16], AES.MODE_CTR, nonce=b"", initial_value=iv)
+    ciphertext = cipher.encrypt(bytes(private_key))
+    return {
+        "version": 3,
+        "id": str(uuid.uuid4()),
+        "address": address.lower().replace("0x", ""),
+        "crypto": {
+            "cipher": "aes-128-ctr",
+            "cipherparams": {"iv": iv.hex()},
+            "ciphertext": ciphertext.hex(),
+            "kdf": "scrypt",
+            "kdfparams": {"dklen": 32, "n": n, "r": r, "p": p, "salt": salt.hex()},
+            "mac": _keccak256(derived[16:32] + ciphertext).hex(),
+        },
+    }
+
+def decrypt_keystore(keystore: Dict[str, Any], password: str) -> bytearray:
+    """Decrypt a keystore v3 document; returns a mutable buffer the caller can zero"""
+    crypto = keystore.get("crypto") or keystore.get("Crypto")
+    if not crypto or crypto.get("kdf") != "scrypt" or crypto.get("cipher") != "aes-128-ctr":
+        raise KeystoreError("Unsupported keystore: only scrypt/aes-128-ctr v3 files are handled")
+
+    params = crypto["kdfparams"]
+    derived = _scrypt(password, bytes.fromhex(params["salt"]), params["n"], params["r"],
+                      params["p"], params["dklen"])
+    ciphertext = bytes.fromhex(crypto["ciphertext"])
+    mac = _keccak256(derived[16:32] + ciphertext)
+    if not hmac.compare_digest(mac, bytes.fromhex(crypto["mac"])):
+        raise KeystoreError("Keystore MAC mismatch (wrong password?)")
+
+    iv = bytes.fromhex(crypto["cipherparams"]["iv"])
+    cipher = AES.new(derived[:16], AES.MODE_CTR, nonce=b"", initial_value=iv)
+    return bytearray(cipher.decrypt(ciphertext))
+
+class MemorySigner:
+    """Decrypted key held once in memory for the life of the process.
+
+    The key lives in a bytearray that zero() overwrites on shutdown. Copies
+    handed to the signing library can't be wiped from Python, so this only
+    shortens how long key material stays in memory; it doesn't guarantee removal.
+    """
+
+    def __init__(self, private_key: bytearray):
+        from viem.accounts import Account
+        self._key = private_key
+        self.account = Account.from_key(bytes(private_key))
+        self.address = self.account.address
+
+    @property
+    def is_zeroed(self) -> bool:
+        return self.account is None
+
+    def private_key_bytes(self) -> Optional[bytes]:
+        return None if self.is_zeroed else bytes(self._key)
+
+    def zero(self):
+        """Overwrite the key buffer and drop the account object"""
+        for i in range(len(self._key)):
+            self._key[i] = 0
+        self.account = None
@@ -2,27 +2,27 @@
 
 import asyncio
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..core.logger import logger
+from ..utils.resilience import RetryableError, retry_async
 from ..config.settings import NADFUN_CONTRACTS
-from viem import create_public_client, http
+from .clients import get_public_client
+from .artifact_store import get_artifact_registry
 
 class NadFunInteractions:
-    def __init__(self, network: str = "testnet"):
+    def __init__(self, network: str = "testnet", public_client: Optional[Any] = None):
         self.network = network
         self.config = NADFUN_CONTRACTS[network]
         self.api_url = self.config["apiUrl"]
-        
-        # Initialize viem public client
-        self.public_client = create_public_client({
-            "chain": {
-                "id": self.config["chainId"],
-                "name": "Monad",
-                "nativeCurrency": {"name": "MON", "symbol": "MON", "decimals": 18},
-                "rpcUrls": {"default": {"http": [self.config["rpcUrl"]]}},
-            },
-            "transport": http(self.config["rpcUrl"]),
-        })
+        self._public_client = public_client
+        self._log_decoder = None
+    
+    @property
+    def public_client(self):
+        """Shared viem public client, built on first contract read"""
+        if self._public_client is None:
+            self._public_client = get_public_client(self.network)
+        return self._public_client
     
     async def get_token_creation_fee(self) -> int:
         """Get the current token creation fee from the bonding curve router"""
@@ -41,23 +41,33 @@ class NadFunInteractions:
             logger.error_blockchain(f"Failed to get token creation fee: {e}")
             return 0
     
-    async def upload_image(self, image_ bytes, content_type: str) -> Optional[Dict[str, Any]]:
+    async def _post_api(self, path: str, retry_statuses=(429, 500, 502, 503, 504),
+                        **kwargs) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """POST to the NadFun API, retrying transient failures; returns (status, json body)"""
+        async def attempt():
+            async with aiohttp.ClientSession() as session:
+                async with session.post(f"{self.api_url}{path}", **kwargs) as response:
+                    if response.status in retry_statuses:
+                        raise RetryableError(f"{path} returned {response.status}", status=response.status)
+                    body = await response.json() if response.status == 200 else None
+                    return response.status, body
+        return await retry_async(attempt, attempts=3, base_delay=0.5)
+    
+    async def upload_image(self, image_data: bytes, content_type: str) -> Optional[Dict[str, Any]]:
         """Upload image to NadFun's image service"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/agent/token/image",
-                    headers={"Content-Type": content_type},
-                    data=image_data
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info_a2a(f"Image uploaded successfully: {result.get('image_uri')}")
-                        return result
-                    else:
-                        logger.error_blockchain(f"Image upload failed: {response.status}")
-                        return None
-                        
+            status, result = await self._post_api(
+                "/agent/token/image",
+                headers={"Content-Type": content_type},
+                data=image_data
+            )
+            if status == 200:
+                logger.info_a2a(f"Image uploaded successfully: {result.get('image_uri')}")
+                return result
+            else:
+                logger.error_blockchain(f"Image upload failed: {status}")
+                return None
+
         except Exception as e:
             logger.error_blockchain(f"Image upload error: {e}")
             return None
@@ -84,20 +94,18 @@ class NadFunInteractions:
             if telegram:
                 metadata_payload["telegram"] = telegram
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/agent/token/metadata",
-                    headers={"Content-Type": "application/json"},
-                    json=metadata_payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info_a2a(f"Metadata uploaded successfully: {result.get('metadata_uri')}")
-                        return result.get("metadata_uri")
-                    else:
-                        logger.error_blockchain(f"Metadata upload failed: {response.status}")
-                        return None
-                        
+            status, result = await self._post_api(
+                "/agent/token/metadata",
+                headers={"Content-Type": "application/json"},
+                json=metadata_payload
+            )
+            if status == 200:
+                logger.info_a2a(f"Metadata uploaded successfully: {result.get('metadata_uri')}")
+                return result.get("metadata_uri")
+            else:
+                logger.error_blockchain(f"Metadata upload failed: {status}")
+                return None
+
         except Exception as e:
             logger.error_blockchain(f"Metadata upload error: {e}")
             return None
@@ -112,23 +120,21 @@ class NadFunInteractions:
                 "metadata_uri": metadata_uri
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/agent/salt",
-                    headers={"Content-Type": "application/json"},
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info_a2a(f"Salt mined successfully: {result.get('address')}")
-                        return result
-                    elif response.status == 408:
-                        logger.warn_risk("Salt mining timed out - try again or use random address")
-                        return None
-                    else:
-                        logger.error_blockchain(f"Salt mining failed: {response.status}")
-                        return None
-                        
+            status, result = await self._post_api(
+                "/agent/salt",
+                headers={"Content-Type": "application/json"},
+                json=payload
+            )
+            if status == 200:
+                logger.info_a2a(f"Salt mined successfully: {result.get('address')}")
+                return result
+            elif status == 408:
+                logger.warn_risk("Salt mining timed out - try again or use random address")
+                return None
+            else:
+                logger.error_blockchain(f"Salt mining failed: {status}")
+                return None
+
         except Exception as e:
             logger.error_blockchain(f"Salt mining error: {e}")
             return None
@@ -175,17 +181,21 @@ class NadFunInteractions:
             logger.error_blockchain(f"Failed to get token progress: {e}")
             return 0
     
+    def decode_curve_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Decode a page of CURVE/DEX_ROUTER logs into columnar arrays, keyed by event name"""
+        if self._log_decoder is None:
+            from .log_decoder import LogDecoder
+            self._log_decoder = LogDecoder(contracts=["Curve", "DexRouter"])
+        return self._log_decoder.decode_page(logs)
+    
     def _get_bonding_curve_router_abi(self):
         """Get BondingCurveRouter ABI"""
-        # This would be imported from abis/router.py
-        return []  # Placeholder
+        return get_artifact_registry().abi("BondingCurveRouter")
     
     def _get_curve_abi(self):
         """Get Curve ABI"""
-        # This would be imported from abis/curve.py
-        return []  # Placeholder
+        return get_artifact_registry().abi("Curve")
     
     def _get_lens_abi(self):
         """Get Lens ABI"""
-        # This would be imported from abis/lens.py
-        return []  # Placeholder
+        return get_artifact_registry().abi("Lens")
@@ -1,11 +1,21 @@
 """Dynamic RPC failover manager for Syndicate agent"""
 
 import asyncio
+import time
 import aiohttp
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 import logging
-from ..utils.helpers import safe_call_async
+from ..utils.rate_limit import AdaptiveTokenBucket
+from ..utils.resilience import (
+    GLOBAL_RETRY_BUDGET, RETRYABLE_STATUSES, RetryBudget, RetryBudgetExhausted,
+    attempt_timeout, backoff_delay, check_deadline, remaining_time
+)
+from ..utils.constants import (
+    RPC_KEEPALIVE_INTERVAL, RPC_WARMUP_CONNECTIONS, RPC_INITIAL_RATE, RPC_MAX_RATE,
+    RPC_BREAKER_FAILURE_THRESHOLD, RPC_BREAKER_RECOVERY_TIMEOUT
+)
+from .circuit_breaker import CircuitBreaker, CircuitState
 
 @dataclass
 class RPCEndpoint:
@@ -13,74 +23,297 @@ class RPCEndpoint:
     priority: int
     weight: float = 1.0
     health_score: float = 1.0
+    latency_ms: Optional[float] = None
+    chain_id_ok: bool = True
+
+class RPCStatusError(Exception):
+    def __init__(self, status: int, url: str):
+        super().__init__(f"Unexpected status {status} from {url}")
+        self.status = status
+        self.url = url
 
 class DynamicFailoverManager:
-    def __init__(self, rpc_endpoints: List[RPCEndpoint]):
+    def __init__(self, rpc_endpoints: List[RPCEndpoint], expected_chain_id: Optional[int] = None,
+                 retry_budget: RetryBudget = GLOBAL_RETRY_BUDGET):
         self.endpoints = sorted(rpc_endpoints, key=lambda x: x.priority)
         self.current_endpoint_idx = 0
         self.session = None
+        self.expected_chain_id = expected_chain_id
+        self.keepalive_task = None
+        self.recorder = None  # optional core.traffic_recorder.TrafficRecorder
+        self.retry_budget = retry_budget
+        self.breakers = {
+            e.url: CircuitBreaker(RPC_BREAKER_FAILURE_THRESHOLD, RPC_BREAKER_RECOVERY_TIMEOUT)
+            for e in self.endpoints
+        }
+        self.limiters = {
+            e.url: AdaptiveTokenBucket(RPC_INITIAL_RATE, max_rate=RPC_MAX_RATE)
+            for e in self.endpoints
+        }
         
     async def get_session(self):
         if not self.session or self.session.closed:
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
-                connector=aiohttp.TCPConnector(limit=50)
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    # Keep idle sockets past the ping interval so pings reuse them
+                    keepalive_timeout=RPC_KEEPALIVE_INTERVAL * 4,
+                    ttl_dns_cache=300,
+                )
             )
         return self.session
     
-    async def call_rpc(self, method: str, params: list):
+    async def warm_up(self, connections_per_endpoint: int = RPC_WARMUP_CONNECTIONS):
+        """Open keep-alive connections to every endpoint and seed the ranking"""
+        await asyncio.gather(*(
+            self._probe_endpoint(endpoint)
+            for endpoint in self.endpoints
+            for _ in range(connections_per_endpoint)
+        ))
+        self._rank_endpoints()
+        usable = [e for e in self.endpoints if e.chain_id_ok and e.latency_ms is not None]
+        logging.info(f"RPC warm-up complete: {len(usable)}/{len(self.endpoints)} endpoints ready")
+        return usable
+    
+    async def _probe_endpoint(self, endpoint: RPCEndpoint) -> bool:
+        """Send a cheap eth_chainId, record latency and check the chain id"""
+        session = await self.get_session()
+        start = time.perf_counter()
+        try:
+            async with session.post(
+                endpoint.url,
+                json={"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1}
+            ) as response:
+                if response.status != 200:
+                    endpoint.health_score = max(0.1, endpoint.health_score - 0.1)
+                    return False
+                result = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f"RPC probe failed for {endpoint.url}: {e}")
+            endpoint.health_score = max(0.1, endpoint.health_score - 0.1)
+            return False
+        
+        latency_ms = (time.perf_counter() - start) * 1000
+        if endpoint.latency_ms is None:
+            endpoint.latency_ms = latency_ms
+        else:
+            endpoint.latency_ms = 0.8 * endpoint.latency_ms + 0.2 * latency_ms
+        
+        if self.expected_chain_id is not None:
+            chain_id = int(result.get("result", "0x0"), 16)
+            if chain_id != self.expected_chain_id:
+                logging.warning(
+                    f"Chain id mismatch on {endpoint.url}: expected {self.expected_chain_id}, got {chain_id}"
+                )
+                endpoint.chain_id_ok = False
+                endpoint.health_score = 0.1
+                return False
+            endpoint.chain_id_ok = True
+        return True
+    
+    def _rank_endpoints(self):
+        """Order endpoints by chain validity, health, measured latency, then priority"""
+        current = self.endpoints[self.current_endpoint_idx]
+        self.endpoints.sort(key=lambda e: (
+            not e.chain_id_ok,
+            -round(e.health_score, 1),
+            e.latency_ms if e.latency_ms is not None else float("inf"),
+            e.priority,
+        ))
+        best = self.endpoints[0]
+        if best is not current and current.chain_id_ok and current.health_score >= best.health_score:
+            # Don't bounce away from a healthy endpoint over latency noise
+            self.current_endpoint_idx = self.endpoints.index(current)
+        else:
+            self.current_endpoint_idx = 0
+    
+    def start_keepalive(self, interval: float = RPC_KEEPALIVE_INTERVAL):
+        """Ping every endpoint periodically so failover targets stay warm"""
+        if self.keepalive_task is None or self.keepalive_task.done():
+            self.keepalive_task = asyncio.create_task(self._keepalive_loop(interval))
+        return self.keepalive_task
+    
+    async def _keepalive_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            # Pings spend real quota, so skip tripped or throttled endpoints
+            await asyncio.gather(*(
+                self._probe_endpoint(e) for e in self.endpoints
+                if self.breakers[e.url].state != CircuitState.OPEN
+                and self.limiters[e.url].try_acquire()
+            ))
+            self._rank_endpoints()
+    
+    async def call_rpc(self, method: str, params: list, endpoint: Optional[RPCEndpoint] = None):
+        """Send one call; `endpoint` pins the first attempt (e.g. to spread a backfill)"""
+        return await self._post(method, params, {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": 1
+        }, endpoint)
+    
+    async def call_rpc_batch(self, calls: List[Tuple[str, list]], max_batch_size: int = 1000) -> List[dict]:
+        """Send many calls as JSON-RPC batches; responses come back in call order.
+        
+        Batches larger than max_batch_size (geth's default batch limit) are split
+        and the chunks sent concurrently, so the cost stays one round trip.
+        """
+        payloads = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": idx}
+            for idx, (method, params) in enumerate(calls)
+        ]
+        chunks = [payloads[i:i + max_batch_size] for i in range(0, len(payloads), max_batch_size)]
+        replies = await asyncio.gather(*(self._post("batch", chunk, chunk) for chunk in chunks))
+        by_id = {}
+        for reply in replies:
+            for item in reply if isinstance(reply, list) else [reply]:
+                by_id[item.get("id")] = item
+        return [by_id.get(idx, {"error": {"message": "missing batch response"}}) for idx in range(len(calls))]
+    
+    async def _post(self, method: str, params: list, payload, preferred: Optional[RPCEndpoint] = None):
+        """Send payload, failing over on throttling, 5xx and connection errors.
+        
+        Retries after the first attempt draw from the shared retry budget and
+        back off with jitter, and every wait is bounded by the caller's
+        deadline (utils.resilience.deadline) when one is set.
+        """
         max_retries = len(self.endpoints)
         retry_count = 0
+        self.retry_budget.record_request()
         
         while retry_count < max_retries:
+            if retry_count:
+                if not self.retry_budget.try_spend():
+                    raise RetryBudgetExhausted(f"RPC retry budget exhausted ({method})")
+                delay = backoff_delay(retry_count - 1, base=0.05, cap=1.0)
+                remaining = remaining_time()
+                await asyncio.sleep(delay if remaining is None else min(delay, max(0.0, remaining)))
+            check_deadline()
+            endpoint = await asyncio.wait_for(
+                self._acquire_endpoint(preferred if retry_count == 0 else None), remaining_time()
+            )
+            start = time.perf_counter()
             try:
-                endpoint = self.endpoints[self.current_endpoint_idx]
                 session = await self.get_session()
+                timeout = attempt_timeout()
+                request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
                 
-                async with session.post(
-                    endpoint.url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "method": method,
-                        "params": params,
-                        "id": 1
-                    }
-                ) as response:
+                async with session.post(endpoint.url, json=payload, timeout=request_timeout) as response:
                     if response.status == 200:
                         result = await response.json()
+                        if self.recorder:
+                            self.recorder.record_rpc(endpoint.url, method, params, 200,
+                                                     (time.perf_counter() - start) * 1000, result)
                         endpoint.health_score = min(1.0, endpoint.health_score + 0.01)
+                        self.breakers[endpoint.url].record_success()
+                        self.limiters[endpoint.url].on_success()
                         return result
-                    elif response.status in [403, 429]:
-                        await self.handle_error_response(response.status, endpoint)
-                        raise Exception(f"RPC Error {response.status}")
-                    else:
-                        await self.handle_error_response(response.status, endpoint)
-                        raise Exception(f"Unexpected status {response.status}")
+                    
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    if self.recorder:
+                        self.recorder.record_rpc(endpoint.url, method, params, response.status,
+                                                 (time.perf_counter() - start) * 1000,
+                                                 retry_after=retry_after)
+                    await self.handle_error_response(response.status, endpoint, retry_after)
+                    if response.status == 403 or response.status in RETRYABLE_STATUSES:
+                        retry_count += 1
+                        continue
+                    raise RPCStatusError(response.status, endpoint.url)
                         
-            except (aiohttp.ClientConnectorError, aiohttp.DNSLookupError):
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if self.recorder:
+                    self.recorder.record_rpc(endpoint.url, method, params, 0,
+                                             (time.perf_counter() - start) * 1000)
+                self.breakers[endpoint.url].record_failure()
                 await self.switch_to_backup_endpoint()
                 retry_count += 1
                 continue
-            except Exception as e:
-                if "429" in str(e) or "403" in str(e):
-                    await self.switch_to_backup_endpoint()
-                    retry_count += 1
-                    await asyncio.sleep(0.1 * retry_count)
-                    continue
-                raise
                 
         raise Exception("All RPC endpoints failed")
     
-    async def handle_error_response(self, status_code: int, endpoint: RPCEndpoint):
+    async def _acquire_endpoint(self, preferred: Optional[RPCEndpoint] = None) -> RPCEndpoint:
+        """Pick the next endpoint that is neither tripped nor out of rate budget.
+        
+        Prefers the current endpoint, then the others in ranking order. If
+        every candidate is throttled the caller queues on the one that frees
+        up first instead of firing into a known-throttled endpoint. A
+        `preferred` endpoint is queued on directly unless its breaker is open.
+        """
+        if preferred is not None and self.breakers[preferred.url].state != CircuitState.OPEN:
+            await self.limiters[preferred.url].acquire()
+            if self.breakers[preferred.url].allow_request():
+                return preferred
+        
+        while True:
+            candidates = []
+            count = len(self.endpoints)
+            for offset in range(count):
+                idx = (self.current_endpoint_idx + offset) % count
+                endpoint = self.endpoints[idx]
+                breaker = self.breakers[endpoint.url]
+                if breaker.state == CircuitState.OPEN and time.monotonic() < breaker.retry_at:
+                    continue
+                if (breaker.state == CircuitState.HALF_OPEN
+                        and breaker.half_open_calls >= breaker.half_open_max_calls):
+                    continue  # a trial call is already in flight
+                limiter = self.limiters[endpoint.url]
+                if limiter.time_until_available() <= 0 and breaker.allow_request():
+                    limiter.try_acquire()
+                    self.current_endpoint_idx = idx
+                    return endpoint
+                candidates.append(endpoint)
+            
+            if candidates:
+                endpoint = min(candidates, key=lambda e: self.limiters[e.url].time_until_available())
+                await self.limiters[endpoint.url].acquire()
+                if self.breakers[endpoint.url].allow_request():
+                    self.current_endpoint_idx = self.endpoints.index(endpoint)
+                    return endpoint
+                continue
+            
+            # Every breaker is open: wait for the earliest half-open window
+            retry_at = min(self.breakers[e.url].retry_at for e in self.endpoints)
+            await asyncio.sleep(max(0.01, retry_at - time.monotonic()))
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After in seconds (HTTP-date values are treated as absent)"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    
+    async def handle_error_response(self, status_code: int, endpoint: RPCEndpoint,
+                                    retry_after: Optional[float] = None):
         endpoint.health_score = max(0.1, endpoint.health_score - 0.1)
-        if status_code in [403, 429]:
-            logging.warning(f"Rate limited or forbidden: {endpoint.url}")
+        breaker = self.breakers[endpoint.url]
+        if status_code == 429:
+            logging.warning(f"Rate limited: {endpoint.url} (retry after {retry_after}s)")
+            self.limiters[endpoint.url].on_throttled(retry_after)
+            if retry_after:
+                breaker.trip(retry_after)
+            else:
+                breaker.record_failure()
             await self.switch_to_backup_endpoint()
+        elif status_code == 403:
+            logging.warning(f"Forbidden: {endpoint.url}")
+            breaker.trip(retry_after)
+            await self.switch_to_backup_endpoint()
+        else:
+            breaker.record_failure()
+            if status_code in RETRYABLE_STATUSES:
+                await self.switch_to_backup_endpoint()
     
     async def switch_to_backup_endpoint(self):
         self.current_endpoint_idx = (self.current_endpoint_idx + 1) % len(self.endpoints)
         logging.info(f"Switched to backup RPC endpoint")
     
     async def close_session(self):
+        if self.keepalive_task and not self.keepalive_task.done():
+            self.keepalive_task.cancel()
         if self.session and not self.session.closed:
             await self.session.close()
@@ -0,0 +1,179 @@
+"""Dry-run trade simulation for Syndicate agent"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from .rpc_manager import DynamicFailoverManager
+from ..core.logger import logger
+from ..utils.abi import decode_abi, keccak256
+
+ERROR_SELECTOR = "0x08c379a0"  # Error(string)
+PANIC_SELECTOR = "0x4e487b71"  # Panic(uint256)
+
+@dataclass
+class SimulationResult:
+    transaction: Dict[str, Any]
+    block: int
+    success: bool
+    return_data: str = "0x"
+    output: Optional[Tuple[Any, ...]] = None
+    gas_used: Optional[int] = None
+    revert_reason: Optional[str] = None
+    error: Optional[str] = None
+
+def mapping_slot(key: str, slot: int) -> str:
+    """Storage slot of `mapping(address => ...)` at `slot` for an address key"""
+    padded_key = bytes.fromhex(key[2:].lower()).rjust(32, b"\0")
+    return "0x" + keccak256(padded_key + slot.to_bytes(32, "big")).hex()
+
+def erc20_balance_override(token: str, holder: str, amount: int, balance_slot: int = 0) -> Dict[str, Any]:
+    """State override giving `holder` `amount` of `token` (balances mapping at `balance_slot`)"""
+    return {token: {"stateDiff": {mapping_slot(holder, balance_slot): "0x" + amount.to_bytes(32, "big").hex()}}}
+
+def merge_overrides(*overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine state override sets; later values win per account field / slot"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for override in overrides:
+        for address, fields in (override or {}).items():
+            account = merged.setdefault(address.lower(), {})
+            for name, value in fields.items():
+                if name in ("stateDiff", "state"):
+                    account.setdefault(name, {}).update(value)
+                else:
+                    account[name] = value
+    return merged
+
+def decode_revert(data: Optional[str]) -> Optional[str]:
+    """Human-readable reason from revert data"""
+    if not data or not isinstance(data, str) or len(data) < 10:
+        return None
+    selector = data[:10].lower()
+    try:
+        if selector == ERROR_SELECTOR:
+            return decode_abi(["string"], data[10:])[0]
+        if selector == PANIC_SELECTOR:
+            return f"panic 0x{decode_abi(['uint256'], data[10:])[0]:02x}"
+    except Exception:
+        pass
+    return f"custom error {selector}"
+
+class TradeSimulator:
+    """Simulate many candidate transactions against one block in a single batch.
+
+    Every candidate becomes an eth_call (for success, return data and revert
+    reason) plus an eth_estimateGas, all pinned to the same block number and
+    sent as one JSON-RPC batch, with optional state overrides per candidate.
+    Storage slots and balances read to build overrides are cached for the
+    current block; the cache is dropped as soon as a newer block is simulated.
+    """
+
+    def __init__(self, rpc_manager: DynamicFailoverManager):
+        self.rpc_manager = rpc_manager
+        self.cache_block: Optional[int] = None
+        self.slot_cache: Dict[Tuple[str, str], int] = {}
+        self.balance_cache: Dict[str, int] = {}
+        self.stats = {"simulations": 0, "batches": 0, "slot_hits": 0, "slot_misses": 0}
+
+    async def block_number(self) -> int:
+        response = await self.rpc_manager.call_rpc("eth_blockNumber", [])
+        return int(response["result"], 16)
+
+    def _use_block(self, block: int):
+        if block != self.cache_block:
+            self.cache_block = block
+            self.slot_cache.clear()
+            self.balance_cache.clear()
+
+    async def get_storage(self, block: int, slots: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """Pre-state storage values at `block`; misses are fetched in one batch"""
+        self._use_block(block)
+        wanted = [(address.lower(), slot) for address, slot in slots]
+        missing = list(dict.fromkeys(key for key in wanted if key not in self.slot_cache))
+        self.stats["slot_hits"] += len(wanted) - len(missing)
+        self.stats["slot_misses"] += len(missing)
+        if missing:
+            responses = await self.rpc_manager.call_rpc_batch([
+                ("eth_getStorageAt", [address, slot, hex(block)]) for address, slot in missing
+            ])
+            for key, response in zip(missing, responses):
+                if isinstance(response.get("result"), str):
+                    self.slot_cache[key] = int(response["result"], 16)
+        return {key: self.slot_cache[key] for key in wanted if key in self.slot_cache}
+
+    async def get_balances(self, block: int, addresses: Iterable[str]) -> Dict[str, int]:
+        """Pre-state native balances at `block`, cached like storage slots"""
+        self._use_block(block)
+        wanted = [a.lower() for a in addresses]
+        missing = list(dict.fromkeys(a for a in wanted if a not in self.balance_cache))
+        if missing:
+            responses = await self.rpc_manager.call_rpc_batch([
+                ("eth_getBalance", [address, hex(block)]) for address in missing
+            ])
+            for address, response in zip(missing, responses):
+                if isinstance(response.get("result"), str):
+                    self.balance_cache[address] = int(response["result"], 16)
+        return {a: self.balance_cache[a] for a in wanted if a in self.balance_cache}
+
+    async def simulate_batch(self, transactions: Sequence[Dict[str, Any]],
+                             overrides: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+                             output_types: Optional[Sequence[Optional[Sequence[str]]]] = None,
+                             block: Optional[int] = None) -> List[SimulationResult]:
+        """Simulate `transactions` at `block` (latest by default), one round trip for all
+
+        `overrides` and `output_types` are optional per-transaction lists:
+        state overrides applied to that call, and ABI types used to decode its
+        return data into SimulationResult.output.
+        """
+        if not transactions:
+            return []
+        if block is None:
+            block = await self.block_number()
+        self._use_block(block)
+        block_tag = hex(block)
+
+        calls = []
+        for i, tx in enumerate(transactions):
+            override = overrides[i] if overrides else None
+            call_params = [tx, block_tag, override] if override else [tx, block_tag]
+            calls.append(("eth_call", call_params))
+            calls.append(("eth_estimateGas", call_params))
+
+        try:
+            responses = await self.rpc_manager.call_rpc_batch(calls)
+        except Exception as e:
+            logger.error_blockchain(f"Simulation batch failed: {e}")
+            return [SimulationResult(tx, block, False, error=str(e)) for tx in transactions]
+        self.stats["batches"] += 1
+        self.stats["simulations"] += len(transactions)
+
+        results = []
+        for i, tx in enumerate(transactions):
+            types = output_types[i] if output_types else None
+            results.append(self._result(tx, block, responses[2 * i], responses[2 * i + 1], types))
+        return results
+
+    async def simulate(self, transaction: Dict[str, Any], override: Optional[Dict[str, Any]] = None,
+                       output_types: Optional[Sequence[str]] = None,
+                       block: Optional[int] = None) -> SimulationResult:
+        results = await self.simulate_batch([transaction], [override], [output_types], block)
+        return results[0]
+
+    def _result(self, tx: Dict[str, Any], block: int, call: Dict[str, Any], gas: Dict[str, Any],
+                output_types: Optional[Sequence[str]]) -> SimulationResult:
+        result = SimulationResult(tx, block, success=False)
+        if "error" in call:
+            error = call["error"]
+            result.error = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            data = error.get("data") if isinstance(error, dict) else None
+            result.revert_reason = decode_revert(data) or result.error
+            return result
+
+        result.success = True
+        result.return_data = call.get("result", "0x")
+        if isinstance(gas.get("result"), str):
+            result.gas_used = int(gas["result"], 16)
+        if output_types:
+            try:
+                result.output = decode_abi(output_types, result.return_data)
+            except Exception as e:
+                logger.warning(f"Could not decode simulation output: {e}")
+        return result
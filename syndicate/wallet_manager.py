@@ -3,72 +3,111 @@
 import os
 import json
 from pathlib import Path
-from viem import create_account, mnemonic_to_account
-from viem.utils import to_checksum_address
+from typing import Optional
+from .keystore import KeystoreError, MemorySigner, decrypt_keystore, encrypt_keystore, is_keystore
 from ..core.logger import logger
-from ..config.settings import NETWORK, FAUCET_API_URL
+from ..config.settings import NETWORK, FAUCET_API_URL, KEYSTORE_PASSWORD
 import aiohttp
 
 class WalletManager:
-    def __init__(self):
-        self.wallet_path = Path.home() / ".syndicate-wallet"
+    def __init__(self, wallet_path: Optional[Path] = None, password: Optional[str] = None):
+        self.wallet_path = wallet_path or Path.home() / ".syndicate-wallet"
+        self.password = password if password is not None else KEYSTORE_PASSWORD
         self.account = None
+        self.signer: Optional[MemorySigner] = None
+        self.wallet_data = None
         
     def create_new_wallet(self) -> dict:
         """Create a new wallet and persist it securely"""
         try:
-            # Create a new account using viem
-            from viem.crypto import generate_mnemonic
-            from viem.accounts import Account
-            
             # Generate a new private key
             from viem.crypto import generate_private_key
-            private_key = generate_private_key()
-            self.account = Account.from_key(private_key)
+            private_key = bytearray(generate_private_key())
+            self.signer = MemorySigner(private_key)
+            self.account = self.signer.account
             
-            # Persist wallet securely
+            # Persist wallet securely (key material is never part of wallet_data)
             wallet_data = {
-                "private_key": private_key.hex(),
                 "address": self.account.address,
                 "network": NETWORK,
                 "created_at": str(self._get_current_time())
             }
-            
-            # Write to secure file with restricted permissions
-            with open(self.wallet_path, 'w') as f:
-                json.dump(wallet_data, f, indent=2)
-            os.chmod(self.wallet_path, 0o600)  # Read/write for owner only
+            self._write_wallet_file(private_key, wallet_data)
             
             logger.success(f"New wallet created and persisted at {self.wallet_path}")
             logger.info(f"Wallet address: {self.account.address}")
             
+            self.wallet_data = wallet_data
             return wallet_data
             
         except Exception as e:
             logger.error(f"Failed to create wallet: {e}")
             return None
     
+    def _write_wallet_file(self, private_key: bytearray, wallet_data: dict):
+        """Write the keystore (or legacy plaintext file when no password is set)"""
+        if self.password:
+            document = encrypt_keystore(private_key, self.password, wallet_data["address"])
+            document.update({"network": wallet_data["network"], "created_at": wallet_data["created_at"]})
+        else:
+            logger.warn_risk("KEYSTORE_PASSWORD not set - wallet key stored unencrypted")
+            document = dict(wallet_data, private_key=private_key.hex())
+        
+        # Write to secure file with restricted permissions, atomically
+        tmp_path = self.wallet_path.with_name(self.wallet_path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # owner only
+        with os.fdopen(fd, 'w') as f:
+            json.dump(document, f, indent=2)
+        os.replace(tmp_path, self.wallet_path)
+    
     def load_wallet(self) -> dict:
-        """Load existing wallet from persistent storage"""
+        """Load existing wallet from persistent storage.
+        
+        The key is decrypted once; later calls return the cached wallet data
+        without touching the disk.
+        """
+        if self.wallet_data and self.signer and not self.signer.is_zeroed:
+            return self.wallet_data
         try:
             if not self.wallet_path.exists():
                 logger.warning("No wallet found, creating new one...")
                 return self.create_new_wallet()
             
             with open(self.wallet_path, 'r') as f:
-                wallet_data = json.load(f)
+                document = json.load(f)
             
             # Validate loaded wallet
-            if wallet_data.get("network") != NETWORK:
-                logger.warn_risk(f"Loaded wallet network mismatch: expected {NETWORK}, got {wallet_data.get('network')}")
+            if document.get("network") != NETWORK:
+                logger.warn_risk(f"Loaded wallet network mismatch: expected {NETWORK}, got {document.get('network')}")
             
-            # Create account from loaded private key
-            from viem.accounts import Account
-            self.account = Account.from_key(bytes.fromhex(wallet_data["private_key"].replace("0x", "")))
+            if is_keystore(document):
+                if not self.password:
+                    raise KeystoreError("Wallet is encrypted but KEYSTORE_PASSWORD is not set")
+                private_key = decrypt_keystore(document, self.password)
+                migrate = False
+            else:
+                private_key = bytearray.fromhex(document["private_key"].replace("0x", ""))
+                migrate = bool(self.password)
+            
+            self.signer = MemorySigner(private_key)
+            self.account = self.signer.account
+            self.wallet_data = {
+                "address": self.account.address,
+                "network": document.get("network"),
+                "created_at": document.get("created_at"),
+            }
+            
+            if migrate:
+                self._write_wallet_file(private_key, self.wallet_data)
+                logger.success(f"Plaintext wallet migrated to encrypted keystore at {self.wallet_path}")
             
             logger.success(f"Wallet loaded from {self.wallet_path}")
-            return wallet_data
+            return self.wallet_data
             
+        except KeystoreError as e:
+            # Never replace an encrypted wallet we merely failed to unlock
+            logger.error(f"Failed to unlock wallet: {e}")
+            return None
         except Exception as e:
             logger.error(f"Failed to load wallet: {e}")
             return self.create_new_wallet()  # Create new if loading fails
@@ -106,11 +145,16 @@ class WalletManager:
     
     def get_wallet_address(self) -> str:
         """Get current wallet address"""
-        if not self.account:
-            wallet_data = self.load_wallet()
-            if wallet_data:
-                return wallet_data["address"]
-        return self.account.address if self.account else None
+        if self.wallet_data:
+            return self.wallet_data["address"]
+        wallet_data = self.load_wallet()
+        return wallet_data["address"] if wallet_data else None
+    
+    def close(self):
+        """Zero the in-memory signer on shutdown"""
+        if self.signer:
+            self.signer.zero()
+        self.account = None
     
     def _get_current_time(self):
         """Get current timestamp"""
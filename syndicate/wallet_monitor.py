@@ -0,0 +1,137 @@
+"""Wallet health monitoring for Syndicate agent"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+from .rpc_manager import DynamicFailoverManager
+from ..core.logger import logger
+from ..config.settings import WALLET_LOW_BALANCE, WALLET_STUCK_AFTER_BLOCKS
+
+@dataclass
+class WalletHealth:
+    address: str
+    balance_wei: int = 0
+    nonce_latest: int = 0
+    nonce_pending: int = 0
+    nonce_stalled_since: Optional[int] = None
+    low_balance: bool = False
+    stuck: bool = False
+
+    @property
+    def pending_count(self) -> int:
+        return max(0, self.nonce_pending - self.nonce_latest)
+
+class WalletMonitor:
+    """Watches many addresses with one batched RPC round trip per block.
+
+    Each check fetches eth_blockNumber plus balance, mined nonce and pending
+    nonce for every address in a single JSON-RPC batch. A wallet is stuck
+    when it has pending transactions but its mined nonce hasn't moved for
+    WALLET_STUCK_AFTER_BLOCKS blocks. Alerts go out once per state change,
+    through the logger and the A2A client if one is attached.
+    """
+
+    def __init__(self, rpc_manager: DynamicFailoverManager, addresses: Optional[Iterable[str]] = None,
+                 a2a_client=None, low_balance_wei: int = int(WALLET_LOW_BALANCE * 10**18),
+                 stuck_after_blocks: int = WALLET_STUCK_AFTER_BLOCKS):
+        self.rpc_manager = rpc_manager
+        self.a2a_client = a2a_client
+        self.low_balance_wei = low_balance_wei
+        self.stuck_after_blocks = stuck_after_blocks
+        self.wallets: Dict[str, WalletHealth] = {}
+        self.last_block: Optional[int] = None
+        for address in addresses or []:
+            self.add_address(address)
+
+    def add_address(self, address: str):
+        self.wallets.setdefault(address.lower(), WalletHealth(address=address.lower()))
+
+    def remove_address(self, address: str):
+        self.wallets.pop(address.lower(), None)
+
+    async def check_health(self) -> Dict[str, Any]:
+        """Refresh all wallets in one batch; evaluate alerts when a new block arrived"""
+        addresses = list(self.wallets)
+        calls = [("eth_blockNumber", [])]
+        for address in addresses:
+            calls.extend([
+                ("eth_getBalance", [address, "latest"]),
+                ("eth_getTransactionCount", [address, "latest"]),
+                ("eth_getTransactionCount", [address, "pending"]),
+            ])
+        try:
+            responses = await self.rpc_manager.call_rpc_batch(calls)
+        except Exception as e:
+            logger.error_blockchain(f"Wallet health batch failed: {e}")
+            return {"status": "error", "error": str(e)}
+
+        block = self._int(responses[0])
+        if block is None or block == self.last_block:
+            return self.summary()
+        self.last_block = block
+
+        alerts = []
+        for i, address in enumerate(addresses):
+            balance, latest, pending = (self._int(r) for r in responses[1 + 3 * i:4 + 3 * i])
+            if None in (balance, latest, pending):
+                continue
+            alerts.extend(self._update(self.wallets[address], block, balance, latest, pending))
+
+        if alerts:
+            await asyncio.gather(*(self._publish(alert) for alert in alerts))
+        return self.summary()
+
+    def _update(self, wallet: WalletHealth, block: int, balance: int, latest: int, pending: int) -> List[Dict]:
+        alerts = []
+        if latest != wallet.nonce_latest or pending <= latest:
+            wallet.nonce_stalled_since = block
+        elif wallet.nonce_stalled_since is None:
+            wallet.nonce_stalled_since = block
+        wallet.balance_wei, wallet.nonce_latest, wallet.nonce_pending = balance, latest, pending
+
+        low = balance < self.low_balance_wei
+        if low and not wallet.low_balance:
+            alerts.append({
+                "risk_type": "wallet_low_balance",
+                "severity": "medium",
+                "details": {"address": wallet.address, "balance_wei": balance, "block": block},
+            })
+        wallet.low_balance = low
+
+        stuck = wallet.pending_count > 0 and block - wallet.nonce_stalled_since >= self.stuck_after_blocks
+        if stuck and not wallet.stuck:
+            alerts.append({
+                "risk_type": "stuck_transaction",
+                "severity": "high",
+                "details": {
+                    "address": wallet.address,
+                    "nonce": latest,
+                    "pending": wallet.pending_count,
+                    "stalled_blocks": block - wallet.nonce_stalled_since,
+                },
+            })
+        wallet.stuck = stuck
+        return alerts
+
+    async def _publish(self, alert: Dict[str, Any]):
+        logger.warn_risk(f"Wallet alert: {alert['risk_type']} for {alert['details']['address']}")
+        if self.a2a_client and self.a2a_client.is_connected:
+            await self.a2a_client.send_message({
+                "type": "risk_alert",
+                "payload": dict(alert, source_agent=self.a2a_client.capability_manifest["agent_id"]),
+                "timestamp": asyncio.get_event_loop().time(),
+            })
+
+    @staticmethod
+    def _int(response: Dict[str, Any]) -> Optional[int]:
+        result = response.get("result")
+        return int(result, 16) if isinstance(result, str) else None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "block": self.last_block,
+            "wallets": len(self.wallets),
+            "low_balance": [w.address for w in self.wallets.values() if w.low_balance],
+            "stuck": [w.address for w in self.wallets.values() if w.stuck],
+        }
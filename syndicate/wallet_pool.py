@@ -0,0 +1,212 @@
+"""Multi-wallet pool for parallel trade execution"""
+
+import asyncio
+import heapq
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .rpc_manager import DynamicFailoverManager
+from .wallet_manager import WalletManager
+from ..core.logger import logger
+from ..config.settings import (
+    WALLET_POOL_SIZE, WALLET_POOL_MNEMONIC, WALLET_POOL_MIN_BALANCE, WALLET_POOL_TARGET_BALANCE
+)
+
+WEI_PER_MON = 10**18
+
+@dataclass
+class PooledWallet:
+    address: str
+    account: Any = None
+    balance_wei: int = 0
+    reserved_wei: int = 0
+    next_nonce: int = 0
+    in_flight: int = 0
+    returned_nonces: List[int] = field(default_factory=list)
+
+    @property
+    def available_wei(self) -> int:
+        return self.balance_wei - self.reserved_wei
+
+    def take_nonce(self) -> int:
+        """Reuse the lowest returned nonce first so the stream never has gaps"""
+        if self.returned_nonces:
+            return heapq.heappop(self.returned_nonces)
+        nonce = self.next_nonce
+        self.next_nonce += 1
+        return nonce
+
+@dataclass
+class WalletLease:
+    wallet: PooledWallet
+    nonce: int
+    reserved_wei: int
+
+class WalletPool:
+    """N trading accounts with per-wallet balance and nonce tracking.
+
+    Trades lease a wallet (plus a nonce and the funds they need) from the
+    least-loaded account that can cover them, so independent trades run on
+    independent nonce streams. A treasury wallet tops up accounts that fall
+    below WALLET_POOL_MIN_BALANCE.
+    """
+
+    def __init__(self, rpc_manager: DynamicFailoverManager, size: int = WALLET_POOL_SIZE,
+                 mnemonic: str = WALLET_POOL_MNEMONIC,
+                 wallet_dir: Optional[Path] = None,
+                 treasury_address: Optional[str] = None):
+        self.rpc_manager = rpc_manager
+        self.size = max(1, size)
+        self.mnemonic = mnemonic
+        self.wallet_dir = wallet_dir or Path.home() / ".syndicate-wallets"
+        self.treasury_address = treasury_address
+        self.wallets: List[PooledWallet] = []
+        self.min_balance_wei = int(WALLET_POOL_MIN_BALANCE * WEI_PER_MON)
+        self.target_balance_wei = int(WALLET_POOL_TARGET_BALANCE * WEI_PER_MON)
+        self._available = asyncio.Condition()
+        self.rebalance_task = None
+        self.journal = None  # optional core.journal.Journal
+
+    def attach_journal(self, journal):
+        """Restore nonce streams saved by the last run; persist changes from now on"""
+        self.journal = journal
+        for wallet in self.wallets:
+            saved = journal.get(f"wallet_pool.{wallet.address.lower()}")
+            if saved:
+                wallet.next_nonce = saved["next_nonce"]
+                wallet.returned_nonces = list(saved["returned_nonces"])
+                heapq.heapify(wallet.returned_nonces)
+
+    def _persist(self, wallet: PooledWallet):
+        if self.journal:
+            self.journal.set(f"wallet_pool.{wallet.address.lower()}", {
+                "next_nonce": wallet.next_nonce,
+                "returned_nonces": list(wallet.returned_nonces),
+            })
+
+    def load(self) -> List[PooledWallet]:
+        """Derive accounts from the pool mnemonic, or load/create one keyfile per wallet"""
+        self.wallets = []
+        if self.mnemonic:
+            from viem import mnemonic_to_account
+            for index in range(self.size):
+                account = mnemonic_to_account(self.mnemonic, address_index=index)
+                self.wallets.append(PooledWallet(address=account.address, account=account))
+        else:
+            self.wallet_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            for index in range(self.size):
+                manager = WalletManager(self.wallet_dir / f"wallet-{index}.json")
+                wallet_data = manager.load_wallet()
+                if wallet_data:
+                    self.wallets.append(PooledWallet(address=wallet_data["address"], account=manager.account))
+        logger.success(f"Wallet pool loaded with {len(self.wallets)} accounts")
+        return self.wallets
+
+    async def refresh(self):
+        """Re-read balances and pending nonces for every wallet"""
+        async def _refresh(wallet: PooledWallet):
+            try:
+                balance, nonce = await asyncio.gather(
+                    self.rpc_manager.call_rpc("eth_getBalance", [wallet.address, "latest"]),
+                    self.rpc_manager.call_rpc("eth_getTransactionCount", [wallet.address, "pending"]),
+                )
+                wallet.balance_wei = int(balance["result"], 16)
+                chain_nonce = int(nonce["result"], 16)
+                if wallet.in_flight == 0:
+                    wallet.next_nonce = chain_nonce
+                    wallet.returned_nonces = []
+                else:
+                    wallet.next_nonce = max(wallet.next_nonce, chain_nonce)
+                self._persist(wallet)
+            except Exception as e:
+                logger.error_blockchain(f"Wallet pool refresh failed for {wallet.address}: {e}")
+
+        await asyncio.gather(*(_refresh(w) for w in self.wallets))
+        async with self._available:
+            self._available.notify_all()
+
+    def _select(self, required_wei: int) -> Optional[PooledWallet]:
+        candidates = [w for w in self.wallets if w.available_wei >= required_wei]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: (w.in_flight, -w.available_wei))
+
+    async def acquire(self, required_wei: int, timeout: float = 5.0) -> Optional[WalletLease]:
+        """Lease the least-loaded wallet that can cover required_wei"""
+        async with self._available:
+            try:
+                wallet = await asyncio.wait_for(
+                    self._available.wait_for(lambda: self._select(required_wei)), timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warn_risk(f"No pooled wallet can cover {required_wei / WEI_PER_MON:.4f} MON")
+                return None
+            wallet.in_flight += 1
+            wallet.reserved_wei += required_wei
+            lease = WalletLease(wallet=wallet, nonce=wallet.take_nonce(), reserved_wei=required_wei)
+            self._persist(wallet)
+            return lease
+
+    async def release(self, lease: WalletLease, spent_wei: int = 0, submitted: bool = True):
+        """Return a lease; an unsubmitted transaction gives its nonce back"""
+        async with self._available:
+            wallet = lease.wallet
+            wallet.in_flight -= 1
+            wallet.reserved_wei -= lease.reserved_wei
+            if submitted:
+                wallet.balance_wei -= spent_wei
+            else:
+                heapq.heappush(wallet.returned_nonces, lease.nonce)
+                self._persist(wallet)
+            self._available.notify_all()
+
+    async def execute(self, executor, transaction_data: Dict[str, Any], priority: str = "normal",
+                      gas_reserve_wei: int = 0) -> Dict[str, Any]:
+        """Run a transaction through the executor from a leased wallet"""
+        value = int(transaction_data.get("value", "0x0"), 16)
+        lease = await self.acquire(value + gas_reserve_wei)
+        if lease is None:
+            return {"status": "rejected", "reason": "no_wallet_capacity"}
+        transaction_data = dict(transaction_data, **{"from": lease.wallet.address, "nonce": hex(lease.nonce)})
+        submitted = False
+        try:
+            result = await executor.execute_transaction_with_priority(transaction_data, priority)
+            submitted = result.get("status") == "success"
+            return result
+        finally:
+            await self.release(lease, spent_wei=value if submitted else 0, submitted=submitted)
+
+    async def rebalance(self, executor) -> int:
+        """Top up wallets below the minimum balance from the treasury; returns transfers sent"""
+        if not self.treasury_address:
+            return 0
+        transfers = 0
+        for wallet in self.wallets:
+            if wallet.balance_wei >= self.min_balance_wei or wallet.address == self.treasury_address:
+                continue
+            amount = self.target_balance_wei - wallet.balance_wei
+            result = await executor.execute_transaction_with_priority({
+                "from": self.treasury_address,
+                "to": wallet.address,
+                "value": hex(amount),
+            }, "low")
+            if result.get("status") == "success":
+                wallet.balance_wei += amount
+                transfers += 1
+                logger.info_monad(f"Rebalanced {wallet.address[:8]}... with {amount / WEI_PER_MON:.4f} MON")
+        if transfers:
+            async with self._available:
+                self._available.notify_all()
+        return transfers
+
+    def start_rebalancer(self, executor, interval: float = 60.0):
+        """Periodically refresh balances and rebalance in the background"""
+        async def _loop():
+            while True:
+                await self.refresh()
+                await self.rebalance(executor)
+                await asyncio.sleep(interval)
+
+        if self.rebalance_task is None or self.rebalance_task.done():
+            self.rebalance_task = asyncio.create_task(_loop())
+        return self.rebalance_task
@@ -0,0 +1,259 @@
+"""Event-driven wallet balance and allowance tracking for Syndicate agent"""
+
+import asyncio
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .rpc_manager import DynamicFailoverManager
+from ..core.logger import logger
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+APPROVAL_TOPIC = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+BALANCE_OF_SELECTOR = "0x70a08231"
+ALLOWANCE_SELECTOR = "0xdd62ed3e"
+
+def _topic_for(address: str) -> str:
+    return "0x" + address.lower().replace("0x", "").rjust(64, "0")
+
+def _address_from_topic(topic: str) -> str:
+    return "0x" + topic[-40:].lower()
+
+class WalletStateTracker:
+    """In-memory native/ERC-20 balances and allowances for our own addresses.
+
+    State moves with our transaction receipts and with Transfer/Approval logs
+    that touch our addresses. A slower reconcile() pass re-reads everything
+    from the chain to catch what logs can't show, such as plain MON transfers
+    in. Pre-trade checks read memory only.
+    """
+
+    def __init__(self, rpc_manager: DynamicFailoverManager, addresses: Iterable[str]):
+        self.rpc_manager = rpc_manager
+        self.addresses = {a.lower() for a in addresses}
+        self.native: Dict[str, int] = {}
+        self.tokens: Dict[Tuple[str, str], int] = {}
+        self.allowances: Dict[Tuple[str, str, str], int] = {}
+        self.watched_tokens: set = set()
+        self.watched_spenders: set = set()
+        self.last_block: Optional[int] = None
+        self.tasks: List[asyncio.Task] = []
+        self.journal = None  # optional core.journal.Journal
+        self.max_catchup_blocks = 2000  # beyond this after downtime, skip logs and let reconcile resync
+
+    def add_address(self, address: str):
+        self.addresses.add(address.lower())
+
+    def watch_token(self, token: str, spender: Optional[str] = None):
+        """Track balances of `token` (and our allowance to `spender`) for every address"""
+        self.watched_tokens.add(token.lower())
+        if spender:
+            self.watched_spenders.add(spender.lower())
+        if self.journal:
+            self.journal.set("wallet_state.watch", {
+                "tokens": sorted(self.watched_tokens), "spenders": sorted(self.watched_spenders),
+            })
+
+    # Persistence
+    def attach_journal(self, journal) -> bool:
+        """Restore balances, watch lists and last block from the journal; True if anything was restored"""
+        self.journal = journal
+        watch = journal.get("wallet_state.watch", {})
+        self.watched_tokens.update(watch.get("tokens", []))
+        self.watched_spenders.update(watch.get("spenders", []))
+        saved = journal.get("wallet_state.balances")
+        if not saved:
+            return False
+        self.native.update({a: v for a, v in saved["native"].items() if a in self.addresses})
+        for key, value in saved["tokens"].items():
+            address, token = key.split("|")
+            if address in self.addresses:
+                self.tokens[(address, token)] = value
+        for key, value in saved["allowances"].items():
+            owner, token, spender = key.split("|")
+            if owner in self.addresses:
+                self.allowances[(owner, token, spender)] = value
+        self.last_block = saved["last_block"]
+        return True
+
+    def _persist(self):
+        if self.journal:
+            self.journal.set("wallet_state.balances", {
+                "native": dict(self.native),
+                "tokens": {"|".join(key): value for key, value in self.tokens.items()},
+                "allowances": {"|".join(key): value for key, value in self.allowances.items()},
+                "last_block": self.last_block,
+            })
+
+    def resume_pending(self) -> List[asyncio.Task]:
+        """Keep tracking transactions that were still pending when the last run stopped"""
+        if not self.journal:
+            return []
+        return [
+            asyncio.create_task(self.track_transaction(key[len("tx.pending."):], transaction))
+            for key, transaction in self.journal.items("tx.pending.")
+        ]
+
+    # Memory reads used on the hot path
+    def native_balance(self, address: str) -> Decimal:
+        return Decimal(self.native.get(address.lower(), 0)) / Decimal(10**18)
+
+    def native_balance_wei(self, address: str) -> int:
+        return self.native.get(address.lower(), 0)
+
+    def token_balance(self, address: str, token: str) -> int:
+        return self.tokens.get((address.lower(), token.lower()), 0)
+
+    def allowance(self, owner: str, token: str, spender: str) -> int:
+        return self.allowances.get((owner.lower(), token.lower(), spender.lower()), 0)
+
+    # Event application
+    def apply_logs(self, logs: List[Dict[str, Any]]):
+        """Apply Transfer/Approval logs that involve our addresses"""
+        for log in logs:
+            topics = log.get("topics", [])
+            if len(topics) < 3:
+                continue
+            token = log["address"].lower()
+            value = int(log.get("data", "0x0") or "0x0", 16)
+            if topics[0] == TRANSFER_TOPIC:
+                sender, recipient = _address_from_topic(topics[1]), _address_from_topic(topics[2])
+                if sender in self.addresses:
+                    key = (sender, token)
+                    self.tokens[key] = max(0, self.tokens.get(key, 0) - value)
+                if recipient in self.addresses:
+                    key = (recipient, token)
+                    self.tokens[key] = self.tokens.get(key, 0) + value
+            elif topics[0] == APPROVAL_TOPIC:
+                owner, spender = _address_from_topic(topics[1]), _address_from_topic(topics[2])
+                if owner in self.addresses:
+                    self.allowances[(owner, token, spender)] = value
+
+    def apply_receipt(self, receipt: Dict[str, Any], transaction: Dict[str, Any]):
+        """Debit value and gas of one of our own transactions, then apply its logs"""
+        sender = (receipt.get("from") or transaction.get("from") or "").lower()
+        if sender in self.addresses:
+            spent = int(receipt.get("gasUsed", "0x0"), 16) * int(receipt.get("effectiveGasPrice", "0x0"), 16)
+            if receipt.get("status") == "0x1":
+                spent += int(transaction.get("value", "0x0"), 16)
+            self.native[sender] = max(0, self.native.get(sender, 0) - spent)
+        recipient = (transaction.get("to") or "").lower()
+        if recipient in self.addresses and receipt.get("status") == "0x1":
+            self.native[recipient] = self.native.get(recipient, 0) + int(transaction.get("value", "0x0"), 16)
+        self.apply_logs(receipt.get("logs", []))
+        self._persist()
+
+    async def track_transaction(self, tx_hash: str, transaction: Dict[str, Any],
+                                poll_interval: float = 0.5, timeout: float = 120.0):
+        """Wait for our transaction's receipt and apply it"""
+        if self.journal:
+            self.journal.set(f"tx.pending.{tx_hash}", transaction)
+        # Cancelled at shutdown, the entry stays journaled for resume_pending()
+        deadline = asyncio.get_event_loop().time() + timeout
+        while asyncio.get_event_loop().time() < deadline:
+            try:
+                result = await self.rpc_manager.call_rpc("eth_getTransactionReceipt", [tx_hash])
+                receipt = result.get("result")
+                if receipt:
+                    self.apply_receipt(receipt, transaction)
+                    if self.journal:
+                        self.journal.delete(f"tx.pending.{tx_hash}")
+                    return receipt
+            except Exception as e:
+                logger.error_blockchain(f"Receipt poll failed for {tx_hash}: {e}")
+            await asyncio.sleep(poll_interval)
+        if self.journal:
+            self.journal.delete(f"tx.pending.{tx_hash}")
+        logger.warn_risk(f"No receipt for {tx_hash} after {timeout}s - waiting for reconcile")
+        return None
+
+    async def poll_logs(self):
+        """Fetch Transfer/Approval logs for our addresses since the last processed block"""
+        latest = int((await self.rpc_manager.call_rpc("eth_blockNumber", []))["result"], 16)
+        if self.last_block is None:
+            self.last_block = latest
+            return
+        if latest <= self.last_block or not self.addresses:
+            return
+        if latest - self.last_block > self.max_catchup_blocks:
+            logger.info_monad(f"Wallet state {latest - self.last_block} blocks behind - resyncing via reconcile")
+            self.last_block = latest
+            await self.reconcile()
+            return
+
+        ours = [_topic_for(a) for a in self.addresses]
+        block_range = {"fromBlock": hex(self.last_block + 1), "toBlock": hex(latest)}
+        queries = [
+            dict(block_range, topics=[TRANSFER_TOPIC, ours]),
+            dict(block_range, topics=[TRANSFER_TOPIC, None, ours]),
+            dict(block_range, topics=[APPROVAL_TOPIC, ours]),
+        ]
+        results = await asyncio.gather(*(self.rpc_manager.call_rpc("eth_getLogs", [q]) for q in queries))
+        seen = set()
+        for result in results:
+            logs = []
+            for log in result.get("result", []):
+                # A transfer between two of our addresses matches both queries
+                key = (log.get("transactionHash"), log.get("logIndex"))
+                if key not in seen:
+                    seen.add(key)
+                    logs.append(log)
+            self.apply_logs(logs)
+        self.last_block = latest
+        self._persist()
+
+    async def reconcile(self):
+        """Re-read every tracked value from the chain and log any drift"""
+        calls = []
+        for address in self.addresses:
+            calls.append(("native", (address,), "eth_getBalance", [address, "latest"]))
+            padded = address.replace("0x", "").rjust(64, "0")
+            for token in self.watched_tokens:
+                calls.append(("token", (address, token), "eth_call",
+                              [{"to": token, "data": BALANCE_OF_SELECTOR + padded}, "latest"]))
+                for spender in self.watched_spenders:
+                    data = ALLOWANCE_SELECTOR + padded + spender.replace("0x", "").rjust(64, "0")
+                    calls.append(("allowance", (address, token, spender), "eth_call",
+                                  [{"to": token, "data": data}, "latest"]))
+
+        results = await asyncio.gather(
+            *(self.rpc_manager.call_rpc(method, params) for _, _, method, params in calls),
+            return_exceptions=True,
+        )
+        drift = 0
+        for (kind, key, _, _), result in zip(calls, results):
+            if isinstance(result, Exception) or "result" not in result:
+                continue
+            value = int(result["result"] or "0x0", 16)
+            table = {"native": self.native, "token": self.tokens, "allowance": self.allowances}[kind]
+            table_key = key[0] if kind == "native" else key
+            if table.get(table_key) not in (None, value):
+                drift += 1
+            table[table_key] = value
+        if drift:
+            logger.info_monad(f"Wallet state reconcile corrected {drift} values")
+        self._persist()
+        return drift
+
+    def start(self, log_interval: float = 1.0, reconcile_interval: float = 60.0):
+        """Run log polling and periodic reconciliation in the background"""
+        async def _logs():
+            while True:
+                try:
+                    await self.poll_logs()
+                except Exception as e:
+                    logger.error_blockchain(f"Wallet log poll failed: {e}")
+                await asyncio.sleep(log_interval)
+
+        async def _reconcile():
+            while True:
+                try:
+                    await self.reconcile()
+                except Exception as e:
+                    logger.error_blockchain(f"Wallet reconcile failed: {e}")
+                await asyncio.sleep(reconcile_interval)
+
+        self.tasks = [asyncio.create_task(_logs()), asyncio.create_task(_reconcile())]
+        return self.tasks
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
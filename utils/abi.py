@@ -0,0 +1,190 @@
+"""In-process Solidity ABI encoding and decoding for Syndicate agent"""
+
+import re
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple
+from Crypto.Hash import keccak
+
+_ARRAY_SUFFIX = re.compile(r"^(.*)\[(\d*)\]$")
+
+def keccak256(data: bytes) -> bytes:
+    return keccak.new(digest_bits=256, data=data).digest()
+
+@lru_cache(maxsize=4096)
+def function_selector(signature: str) -> bytes:
+    """4-byte selector for e.g. 'transfer(address,uint256)'"""
+    return keccak256(signature.replace(" ", "").encode())[:4]
+
+@lru_cache(maxsize=4096)
+def event_topic(signature: str) -> str:
+    """topic0 (0x-hex) for e.g. 'Transfer(address,address,uint256)'"""
+    return "0x" + keccak256(signature.replace(" ", "").encode()).hex()
+
+def split_types(type_list: str) -> List[str]:
+    """Split 'address,(uint256,bool)[],string' at top-level commas"""
+    types, depth, current = [], 0, ""
+    for char in type_list.replace(" ", ""):
+        if char == "," and depth == 0:
+            types.append(current)
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current:
+        types.append(current)
+    return types
+
+def signature_types(signature: str) -> List[str]:
+    """Parameter types of 'name(type,...)' (or a bare '(type,...)' list)"""
+    inner = signature[signature.index("(") + 1:signature.rindex(")")]
+    return split_types(inner)
+
+def canonical_type(param: dict) -> str:
+    """ABI JSON parameter -> canonical type string (tuples expanded)"""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        inner = ",".join(canonical_type(c) for c in param.get("components", []))
+        return f"({inner}){abi_type[len('tuple'):]}"
+    return abi_type
+
+@lru_cache(maxsize=4096)
+def is_dynamic(abi_type: str) -> bool:
+    match = _ARRAY_SUFFIX.match(abi_type)
+    if match:
+        return match.group(2) == "" or is_dynamic(match.group(1))
+    if abi_type.startswith("("):
+        return any(is_dynamic(t) for t in split_types(abi_type[1:-1]))
+    return abi_type in ("bytes", "string")
+
+@lru_cache(maxsize=4096)
+def head_size(abi_type: str) -> int:
+    """Bytes the type occupies in the head section"""
+    if is_dynamic(abi_type):
+        return 32
+    match = _ARRAY_SUFFIX.match(abi_type)
+    if match:
+        return int(match.group(2)) * head_size(match.group(1))
+    if abi_type.startswith("("):
+        return sum(head_size(t) for t in split_types(abi_type[1:-1]))
+    return 32
+
+# Encoding
+
+def _encode_static_word(abi_type: str, value: Any) -> bytes:
+    if abi_type == "address":
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value).rjust(32, b"\0")
+    if abi_type == "bool":
+        return (1 if value else 0).to_bytes(32, "big")
+    if abi_type.startswith("uint"):
+        return int(value).to_bytes(32, "big")
+    if abi_type.startswith("int"):
+        return int(value).to_bytes(32, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        raw = bytes.fromhex(value[2:]) if isinstance(value, str) else bytes(value)
+        return raw.ljust(32, b"\0")
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+def _encode_sequence(types: Sequence[str], values: Sequence[Any]) -> bytes:
+    if len(types) != len(values):
+        raise ValueError(f"Expected {len(types)} values, got {len(values)}")
+    heads, tails = [], []
+    offset = sum(head_size(t) for t in types)
+    for abi_type, value in zip(types, values):
+        encoded = encode_single(abi_type, value)
+        if is_dynamic(abi_type):
+            heads.append(offset.to_bytes(32, "big"))
+            tails.append(encoded)
+            offset += len(encoded)
+        else:
+            heads.append(encoded)
+    return b"".join(heads) + b"".join(tails)
+
+def encode_single(abi_type: str, value: Any) -> bytes:
+    match = _ARRAY_SUFFIX.match(abi_type)
+    if match:
+        item_type, length = match.group(1), match.group(2)
+        body = _encode_sequence([item_type] * len(value), list(value))
+        return body if length else len(value).to_bytes(32, "big") + body
+    if abi_type.startswith("("):
+        return _encode_sequence(split_types(abi_type[1:-1]), list(value))
+    if abi_type in ("bytes", "string"):
+        raw = value.encode() if abi_type == "string" else (
+            bytes.fromhex(value[2:]) if isinstance(value, str) else bytes(value))
+        padded = raw.ljust((len(raw) + 31) // 32 * 32, b"\0")
+        return len(raw).to_bytes(32, "big") + padded
+    return _encode_static_word(abi_type, value)
+
+def encode_abi(types: Sequence[str], values: Sequence[Any]) -> bytes:
+    """ABI-encode values as a parameter tuple"""
+    return _encode_sequence(list(types), list(values))
+
+def encode_function_call(signature: str, values: Sequence[Any]) -> str:
+    """0x-hex calldata for signature 'name(type,...)'"""
+    return "0x" + (function_selector(signature) + encode_abi(signature_types(signature), values)).hex()
+
+# Decoding
+
+def _decode_at(abi_type: str, data: bytes, offset: int) -> Any:
+    """Decode a type whose encoding starts at `offset`"""
+    match = _ARRAY_SUFFIX.match(abi_type)
+    if match:
+        item_type, length = match.group(1), match.group(2)
+        if length:
+            return _decode_sequence([item_type] * int(length), data, offset)
+        count = int.from_bytes(data[offset:offset + 32], "big")
+        return _decode_sequence([item_type] * count, data, offset + 32)
+    if abi_type.startswith("("):
+        return tuple(_decode_sequence(split_types(abi_type[1:-1]), data, offset))
+    if abi_type in ("bytes", "string"):
+        length = int.from_bytes(data[offset:offset + 32], "big")
+        raw = data[offset + 32:offset + 32 + length]
+        return raw.decode("utf-8", errors="replace") if abi_type == "string" else raw
+    word = data[offset:offset + 32]
+    if abi_type == "address":
+        return "0x" + word[12:].hex()
+    if abi_type == "bool":
+        return word[-1] == 1
+    if abi_type.startswith("uint"):
+        return int.from_bytes(word, "big")
+    if abi_type.startswith("int"):
+        return int.from_bytes(word, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        return word[:int(abi_type[5:])]
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+def _decode_sequence(types: Sequence[str], data: bytes, base: int) -> List[Any]:
+    values, position = [], base
+    for abi_type in types:
+        if is_dynamic(abi_type):
+            pointer = int.from_bytes(data[position:position + 32], "big")
+            values.append(_decode_at(abi_type, data, base + pointer))
+        else:
+            values.append(_decode_at(abi_type, data, position))
+        position += head_size(abi_type)
+    return values
+
+def decode_abi(types: Sequence[str], data: bytes) -> Tuple[Any, ...]:
+    """Decode an ABI-encoded parameter tuple"""
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    return tuple(_decode_sequence(list(types), data, 0))
+
+# cast-style string arguments
+
+def parse_cli_value(abi_type: str, raw: Any) -> Any:
+    """Convert a `cast abi-encode`-style string argument to a Python value"""
+    if not isinstance(raw, str):
+        return raw
+    match = _ARRAY_SUFFIX.match(abi_type)
+    if match:
+        inner = raw.strip()[1:-1]
+        return [parse_cli_value(match.group(1), item) for item in split_types(inner)] if inner else []
+    if abi_type.startswith("("):
+        return tuple(parse_cli_value(t, v) for t, v in
+                     zip(split_types(abi_type[1:-1]), split_types(raw.strip()[1:-1])))
+    if abi_type == "bool":
+        return raw.lower() == "true"
+    if abi_type.startswith(("uint", "int")):
+        return int(raw, 0)
+    return raw.strip('"') if abi_type == "string" else raw
@@ -24,3 +24,11 @@ NETWORK_GAS_LIMITS = {
 DEFAULT_TIMEOUT = 30
 HEARTBEAT_INTERVAL = 30
 RPC_TIMEOUT = 30
+RPC_KEEPALIVE_INTERVAL = 15
+RPC_WARMUP_CONNECTIONS = 2
+RPC_INITIAL_RATE = 50.0  # requests/second per endpoint before anything is learned
+RPC_MAX_RATE = 500.0
+RPC_BREAKER_FAILURE_THRESHOLD = 5
+RPC_BREAKER_RECOVERY_TIMEOUT = 10.0
+RETRY_BUDGET_RATIO = 0.1  # retries allowed per request sent
+RETRY_BUDGET_MIN_PER_SECOND = 1.0
@@ -1,17 +1,27 @@
 """Helper functions for Syndicate agent"""
 
 import asyncio
-from typing import Awaitable, Any
+import inspect
+from typing import Any, Awaitable, Callable, Union
+from .resilience import retry_async
 
-async def safe_call_async(func: Awaitable, default_value: Any = None, retries: int = 3):
-    """Safely call async function with retries"""
-    for attempt in range(retries):
-        try:
-            return await func
-        except Exception as e:
-            if attempt == retries - 1:
-                return default_value
-            await asyncio.sleep(0.1 * (attempt + 1))
+async def safe_call_async(func: Union[Callable[[], Awaitable], Awaitable], default_value: Any = None,
+                          retries: int = 3):
+    """Call an async function with retries, returning default_value on failure
+
+    Pass a factory (e.g. `lambda: client.fetch(x)`) so each retry gets a fresh
+    coroutine; a bare awaitable can only be awaited once, so it isn't retried.
+    Cancellation is propagated, not swallowed.
+    """
+    if inspect.isawaitable(func):
+        awaitable, retries = func, 1
+        func = lambda: awaitable
+    try:
+        return await retry_async(func, attempts=retries, retryable=lambda e: True, budget=None)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return default_value
 
 def format_address(address: str) -> str:
     """Format address for display"""
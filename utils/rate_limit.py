@@ -0,0 +1,94 @@
+"""Token-bucket rate limiting for Syndicate agent"""
+
+import asyncio
+import time
+from typing import Optional
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` can be taken (0 if available now)"""
+        now = time.monotonic()
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.tokens < tokens:
+            wait = max(wait, (tokens - self.tokens) / self.rate)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens without waiting; False if the bucket can't cover them"""
+        if self.time_until_available(tokens) > 0:
+            return False
+        self.tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait in FIFO order until tokens are available, then take them"""
+        async with self._lock:
+            while True:
+                wait = self.time_until_available(tokens)
+                if wait <= 0:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """Refuse all tokens for the next `seconds` (e.g. a Retry-After window)"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket that learns a sustainable rate from throttling responses.
+
+    Successes raise the rate additively up to a learned ceiling; a throttle
+    halves the rate and pins the ceiling just below the rate that tripped it.
+    A long run of successes at the ceiling lets it creep up again so a
+    provider that raised our quota is eventually noticed.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 1.0, max_rate: float = 1000.0,
+                 increase_step: float = 1.0, probe_after: int = 200):
+        super().__init__(rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.ceiling = max_rate
+        self.increase_step = increase_step
+        self.probe_after = probe_after
+        self.successes_at_ceiling = 0
+        self.throttle_count = 0
+
+    def _set_rate(self, rate: float):
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+        self.capacity = max(1.0, self.rate)
+        self.tokens = min(self.tokens, self.capacity)
+
+    def on_success(self):
+        """Additive increase towards the learned ceiling"""
+        if self.rate < self.ceiling:
+            self._set_rate(min(self.ceiling, self.rate + self.increase_step))
+            return
+        self.successes_at_ceiling += 1
+        if self.successes_at_ceiling >= self.probe_after:
+            self.successes_at_ceiling = 0
+            self.ceiling = min(self.max_rate, self.ceiling * 1.05)
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """Multiplicative decrease; honour Retry-After when the server sent one"""
+        self.throttle_count += 1
+        self.successes_at_ceiling = 0
+        self.ceiling = max(self.min_rate, self.rate * 0.9)
+        self._set_rate(self.rate * 0.5)
+        self.block_for(retry_after if retry_after is not None else 1.0 / self.rate)
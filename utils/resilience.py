@@ -0,0 +1,152 @@
+"""Retry, backoff and deadline helpers for Syndicate agent"""
+
+import asyncio
+import contextvars
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+import aiohttp
+from .constants import RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_PER_SECOND
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+class RetryableError(Exception):
+    """Raise from an attempt to ask for a retry (e.g. a 503 response)"""
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class RetryBudgetExhausted(Exception):
+    pass
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    pass
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transient network/server failures are retryable; everything else is not"""
+    if isinstance(exc, asyncio.CancelledError):
+        return False
+    if isinstance(exc, (RetryableError, asyncio.TimeoutError, ConnectionError, aiohttp.ClientConnectionError)):
+        return not isinstance(exc, DeadlineExceeded)
+    status = getattr(exc, "status", None)
+    return isinstance(status, int) and status in RETRYABLE_STATUSES
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))"""
+    return random.uniform(0, min(cap, base * (2 ** min(attempt, 32))))
+
+class RetryBudget:
+    """Caps retries at a fraction of request traffic.
+
+    Every request deposits `ratio` tokens and every retry spends one, so in
+    steady state at most ratio * requests retries go out no matter how many
+    callers are failing. `min_per_second` keeps a trickle of retries
+    available when traffic is low.
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND,
+                 capacity: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.balance = capacity * ratio
+        self.last_refill = time.monotonic()
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.balance = min(self.capacity, self.balance + (now - self.last_refill) * self.min_per_second)
+        self.last_refill = now
+
+    def record_request(self):
+        self._refill()
+        self.requests += 1
+        self.balance = min(self.capacity, self.balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False means don't retry"""
+        self._refill()
+        if self.balance >= 1.0:
+            self.balance -= 1.0
+            self.retries += 1
+            return True
+        self.rejected += 1
+        return False
+
+# Shared by the RPC manager and REST clients so a failing dependency can't
+# multiply total traffic
+GLOBAL_RETRY_BUDGET = RetryBudget()
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("deadline", default=None)
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Bound everything in this block (and tasks it spawns) to `seconds`.
+
+    Nested deadlines can only shorten the enclosing one.
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires = min(expires, current)
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+def remaining_time() -> Optional[float]:
+    """Seconds left on the current deadline, or None when unbounded"""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+def check_deadline():
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("deadline exceeded")
+
+def attempt_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """Per-attempt timeout clipped to the current deadline"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
+
+async def retry_async(factory: Callable[[], Awaitable[Any]], attempts: int = 3, base_delay: float = 0.1,
+                      max_delay: float = 10.0, timeout: Optional[float] = None,
+                      budget: Optional[RetryBudget] = GLOBAL_RETRY_BUDGET,
+                      retryable: Callable[[BaseException], bool] = is_retryable) -> Any:
+    """Await factory() until it succeeds, retrying transient failures.
+
+    `factory` must build a fresh awaitable per attempt. Retries stop when
+    attempts run out, the error isn't retryable, the budget is empty or the
+    backoff would overrun the current deadline; the last error is raised.
+    Cancellation is never retried or swallowed.
+    """
+    if budget:
+        budget.record_request()
+    attempt = 0
+    while True:
+        check_deadline()
+        try:
+            limit = attempt_timeout(timeout)
+            if limit is None:
+                return await factory()
+            return await asyncio.wait_for(factory(), limit)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            attempt += 1
+            if attempt >= attempts or not retryable(e):
+                raise
+            delay = max(backoff_delay(attempt - 1, base_delay, max_delay), getattr(e, "retry_after", None) or 0)
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                raise
+            if budget and not budget.try_spend():
+                raise
+            await asyncio.sleep(delay)